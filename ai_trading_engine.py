@@ -7,8 +7,10 @@ from sklearn.preprocessing import MinMaxScaler
 from sklearn.ensemble import RandomForestRegressor
 import ta
 import requests
+import orjson
 from datetime import datetime, timedelta
 import asyncio
+import time
 from sentiment_analyzer import SentimentAnalyzer
 from risk_analyzer import RiskAnalyzer
 
@@ -33,19 +35,29 @@ class AITradingEngine:
             if self.model is None:
                 self._init_model()
 
+            # Sentiment-Abruf (Netzwerk) und technische Indikatoren (CPU) laufen parallel
+            sentiment_result, indicators = await asyncio.gather(
+                self.sentiment_analyzer.analyze_market_sentiment(),
+                asyncio.to_thread(self._compute_indicators, current_data),
+                return_exceptions=True
+            )
+
             # Hole Sentiment-Daten
-            try:
-                sentiment_data = await self.sentiment_analyzer.analyze_market_sentiment()
-                current_data['sentiment_score'] = sentiment_data.get('overall_score', 0.5)
-                logger.info(f"Sentiment Score: {current_data['sentiment_score']:.2f}")
-            except Exception as e:
-                logger.error(f"Fehler bei der Sentiment-Analyse: {e}")
+            if isinstance(sentiment_result, Exception):
+                logger.error(f"Fehler bei der Sentiment-Analyse: {sentiment_result}")
                 current_data['sentiment_score'] = 0.5  # Fallback zu neutral
                 sentiment_data = {'overall_score': 0.5}
+            else:
+                sentiment_data = sentiment_result
+                current_data['sentiment_score'] = sentiment_data.get('overall_score', 0.5)
+                logger.info(f"Sentiment Score: {sentiment_data.get('overall_score', 0.5):.2f}")
 
             # Feature-Extraktion
             try:
-                X = self.prepare_features(current_data)
+                if isinstance(indicators, Exception):
+                    raise indicators
+                indicators['sentiment_score'] = current_data['sentiment_score']
+                X = self.prepare_features(current_data, indicators=indicators)
                 if len(X) == 0:
                     logger.warning("Keine Features extrahiert, verwende technische Analyse")
                     return self._predict_with_technical_analysis(current_data)
@@ -117,7 +129,7 @@ class AITradingEngine:
                     'stoploss': stoploss,
                     'takeprofit': takeprofit
                 },
-                'timestamp': pd.Timestamp.now().timestamp()
+                'timestamp': time.time()
             }
 
             logger.info(f"Prediction generiert: Preis {predicted_price:.2f}, "
@@ -143,41 +155,48 @@ class AITradingEngine:
             logger.error(f"Fehler bei der Modell-Initialisierung: {e}")
             self.model = None
 
-    def prepare_features(self, price_data: pd.DataFrame) -> np.ndarray:
+    def _compute_indicators(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """Berechnet die technischen Indikatoren auf einer Kopie der Preisdaten"""
+        df = price_data.copy()
+
+        # Technische Indikatoren
+        df['rsi'] = ta.momentum.RSIIndicator(df['close']).rsi()
+        macd_indicator = ta.trend.MACD(df['close'])
+        df['macd'] = macd_indicator.macd()
+        df['macd_signal'] = macd_indicator.macd_signal()
+
+        bollinger = ta.volatility.BollingerBands(df['close'])
+        df['bb_upper'] = bollinger.bollinger_hband()
+        df['bb_lower'] = bollinger.bollinger_lband()
+        df['bb_mavg'] = bollinger.bollinger_mavg()
+
+        # Volumen-Indikatoren
+        df['volume_sma'] = ta.trend.sma_indicator(df['volume'], window=20)
+        df['volume_ema'] = ta.trend.ema_indicator(df['volume'], window=20)
+
+        # Neue technische Indikatoren
+        df['stoch_k'] = ta.momentum.StochasticOscillator(df['high'], df['low'], df['close']).stoch()
+        df['stoch_d'] = ta.momentum.StochasticOscillator(df['high'], df['low'], df['close']).stoch_signal()
+        df['adx'] = ta.trend.ADXIndicator(df['high'], df['low'], df['close']).adx()
+
+        # Preisbewegungen
+        df['price_change'] = df['close'].pct_change()
+        df['volatility'] = df['close'].rolling(window=20).std()
+        df['volume_change'] = df['volume'].pct_change()
+        df['trend_strength'] = abs(df['price_change'].rolling(window=10).mean())
+
+        # Erweiterte Preismetriken
+        df['price_momentum'] = df['close'].diff(periods=5) / df['close'].shift(5)
+        df['volume_intensity'] = df['volume'] / df['volume'].rolling(window=20).mean()
+        df['price_acceleration'] = df['price_change'].diff()
+
+        return df
+
+    def prepare_features(self, price_data: pd.DataFrame,
+                         indicators: Optional[pd.DataFrame] = None) -> np.ndarray:
         """Bereitet Features für das ML-Modell vor"""
         try:
-            df = price_data.copy()
-
-            # Technische Indikatoren
-            df['rsi'] = ta.momentum.RSIIndicator(df['close']).rsi()
-            macd_indicator = ta.trend.MACD(df['close'])
-            df['macd'] = macd_indicator.macd()
-            df['macd_signal'] = macd_indicator.macd_signal()
-
-            bollinger = ta.volatility.BollingerBands(df['close'])
-            df['bb_upper'] = bollinger.bollinger_hband()
-            df['bb_lower'] = bollinger.bollinger_lband()
-            df['bb_mavg'] = bollinger.bollinger_mavg()
-
-            # Volumen-Indikatoren
-            df['volume_sma'] = ta.trend.sma_indicator(df['volume'], window=20)
-            df['volume_ema'] = ta.trend.ema_indicator(df['volume'], window=20)
-
-            # Neue technische Indikatoren
-            df['stoch_k'] = ta.momentum.StochasticOscillator(df['high'], df['low'], df['close']).stoch()
-            df['stoch_d'] = ta.momentum.StochasticOscillator(df['high'], df['low'], df['close']).stoch_signal()
-            df['adx'] = ta.trend.ADXIndicator(df['high'], df['low'], df['close']).adx()
-
-            # Preisbewegungen
-            df['price_change'] = df['close'].pct_change()
-            df['volatility'] = df['close'].rolling(window=20).std()
-            df['volume_change'] = df['volume'].pct_change()
-            df['trend_strength'] = abs(df['price_change'].rolling(window=10).mean())
-
-            # Erweiterte Preismetriken
-            df['price_momentum'] = df['close'].diff(periods=5) / df['close'].shift(5)
-            df['volume_intensity'] = df['volume'] / df['volume'].rolling(window=20).mean()
-            df['price_acceleration'] = df['price_change'].diff()
+            df = indicators if indicators is not None else self._compute_indicators(price_data)
 
             # Sentiment Features
             if 'sentiment_score' in df.columns:
@@ -199,7 +218,7 @@ class AITradingEngine:
             self.feature_columns = feature_columns #Added for later use
 
             # Entferne NaN-Werte
-            df = df.fillna(method='ffill').fillna(method='bfill')
+            df = df.ffill().bfill()
 
             # Skaliere Features
             features = df[feature_columns].values
@@ -338,7 +357,7 @@ class AITradingEngine:
                 'price_change': price_change,
                 'volatility': data['close'].std(),
                 'volume_trend': volume_change,
-                'timestamp': pd.Timestamp.now().timestamp()
+                'timestamp': time.time()
             }
 
         except Exception as e:
@@ -366,7 +385,7 @@ class AITradingEngine:
                 }
                 response = requests.get(coingecko_url, params=params, headers=headers, timeout=10)
                 if response.status_code == 200:
-                    data['coingecko'] = response.json()
+                    data['coingecko'] = orjson.loads(response.content)
                     logger.info("CoinGecko Daten erfolgreich abgerufen")
                 else:
                     logger.warning(f"CoinGecko API Fehler: {response.status_code}")
@@ -384,7 +403,7 @@ class AITradingEngine:
                 logger.info(f"DEX Screener Response Status: {response.status_code}, Response: {response_text}")
 
                 if response.status_code == 200:
-                    token_data = response.json()
+                    token_data = orjson.loads(response.content)
                     if 'pairs' in token_data:
                         # Filter für USDC Paare
                         usdc_pairs = [
@@ -414,7 +433,7 @@ class AITradingEngine:
                 response = requests.get(pairs_url, headers=headers, timeout=15)
 
                 if response.status_code == 200:
-                    pairs_data = response.json()
+                    pairs_data = orjson.loads(response.content)
                     if 'pairs' in pairs_data:
                         sol_pairs = [
                             pair for pair in pairs_data['pairs']
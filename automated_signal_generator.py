@@ -1,13 +1,19 @@
 """AI Trading Engine mit ML-basierter Signalgenerierung und Marktanalyse"""
 import logging
+import math
+import time
+import queue
+import threading
 from datetime import datetime, timedelta
 import numpy as np
+from numba import njit
 import pandas as pd
 from typing import Dict, Any, Optional
 from sklearn.ensemble import RandomForestRegressor
 from apscheduler.schedulers.background import BackgroundScheduler
 import pytz
 import requests
+import orjson
 from dex_connector import DexConnector
 from chart_analyzer import ChartAnalyzer
 from signal_processor import SignalProcessor
@@ -15,6 +21,94 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 logger = logging.getLogger(__name__)
 
+# Gewichtung der Signalqualität: Trend, Stärke, Profit, Volumen
+QUALITY_WEIGHTS = (0.35, 0.25, 0.25, 0.15)
+
+# Grundbewertung je Trendrichtung, unbekannte Trends zählen wie abwärts
+TREND_BASE_SCORES = {'aufwärts': 8.0, 'abwärts': 7.0, 'neutral': 7.0}
+
+
+# Explizite Signatur: Kompilierung bei der Deklaration statt beim ersten Signal
+@njit('UniTuple(float64, 5)(float64, float64, float64, float64, float64)', cache=True)
+def _quality_core(trend_base: float, momentum: float, volatility: float,
+                  expected_profit: float, volume_trend: float):
+    """Numerischer Kern der Signalqualität, liefert (Trend, Stärke, Profit, Volumen, Qualität)"""
+    # Momentum-basierte Stärkebewertung mit Volatilitäts-Anpassung
+    strength_score = min(abs(momentum) * 20.0, 10.0)
+    strength_score *= max(0.5, 1.0 - volatility)
+
+    # Profit-Bewertung - Progressive Skala, stückweise linear ohne Verzweigungen:
+    # 5 Punkte je % bis 1%, 3 Punkte je % bis 2%, danach 1 Punkt je % (0.5% = 2.5, 1.5% = 6.5, max 10)
+    profit_score = (
+        min(expected_profit, 1.0) * 5.0 +
+        min(max(expected_profit - 1.0, 0.0), 1.0) * 3.0 +
+        min(max(expected_profit - 2.0, 0.0), 2.0)
+    )
+
+    # Volumen-Trend Bewertung
+    volume_score = min(abs(volume_trend) * 10.0, 10.0)
+
+    quality = (
+        trend_base * QUALITY_WEIGHTS[0] +
+        strength_score * QUALITY_WEIGHTS[1] +
+        profit_score * QUALITY_WEIGHTS[2] +
+        volume_score * QUALITY_WEIGHTS[3]
+    )
+    return trend_base, strength_score, profit_score, volume_score, min(quality, 10.0)
+
+
+class NotificationQueue:
+    """Versendet Telegram-Nachrichten gedrosselt aus einem Hintergrund-Thread"""
+
+    def __init__(self, bot, max_per_second: float = 30.0):
+        self.bot = bot
+        self.send_interval = 1.0 / max_per_second  # Telegram erlaubt ca. 30 Nachrichten/s
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, chat_id: int, caption: str, photo: Optional[bytes] = None, reply_markup=None):
+        """Reiht eine Nachricht ein, ohne auf den Versand zu warten"""
+        self._queue.put((chat_id, caption, photo, reply_markup))
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="notification-queue", daemon=True)
+                self._worker.start()
+
+    def close(self):
+        """Beendet den Versand-Thread, sobald die Warteschlange abgearbeitet ist"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                self._queue.put(None)
+                self._worker.join()
+            self._worker = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            chat_id, caption, photo, reply_markup = item
+            try:
+                if photo:
+                    self.bot.updater.bot.send_photo(
+                        chat_id=chat_id,
+                        photo=photo,
+                        caption=caption,
+                        reply_markup=reply_markup
+                    )
+                else:
+                    self.bot.updater.bot.send_message(
+                        chat_id=chat_id,
+                        text=caption,
+                        reply_markup=reply_markup
+                    )
+                logger.info(f"Signal erfolgreich an User {chat_id} gesendet")
+            except Exception as e:
+                logger.error(f"Fehler beim Senden des Signals an User {chat_id}: {e}")
+            time.sleep(self.send_interval)
+
+
 class AutomatedSignalGenerator:
     def __init__(self, dex_connector: DexConnector, signal_processor: SignalProcessor, bot):
         """Initialisiere den Signal Generator"""
@@ -22,6 +116,7 @@ class AutomatedSignalGenerator:
         self.signal_processor = signal_processor
         self.chart_analyzer = ChartAnalyzer()
         self.bot = bot
+        self.notification_queue = NotificationQueue(bot)
         self.scheduler = BackgroundScheduler(timezone=pytz.UTC)
         self.is_running = False
         self.last_check_time = None
@@ -193,6 +288,7 @@ class AutomatedSignalGenerator:
             self.scheduler.remove_job('signal_generator')
             self.scheduler.shutdown()
             self.is_running = False
+            self.notification_queue.close()
             logger.info("Signal-Generator gestoppt")
 
     def fetch_market_data(self) -> Dict[str, Any]:
@@ -210,7 +306,7 @@ class AutomatedSignalGenerator:
             }
             response = requests.get(coingecko_url, params=params)
             if response.status_code == 200:
-                data['coingecko'] = response.json()
+                data['coingecko'] = orjson.loads(response.content)
 
             # Solana RPC Daten
             rpc_payload = {
@@ -220,7 +316,7 @@ class AutomatedSignalGenerator:
             }
             response = requests.post(self.solana_rpc, json=rpc_payload)
             if response.status_code == 200:
-                data['solana_rpc'] = response.json()
+                data['solana_rpc'] = orjson.loads(response.content)
 
             # DEX Daten für Chart Updates
             dex_data = self.dex_connector.get_market_info("SOL")
@@ -329,7 +425,7 @@ class AutomatedSignalGenerator:
 
             # Erhöhte Mindest-Trendstärke für bessere Signalqualität
             if trend == 'neutral' or strength < 0.03:  # Erhöht von 0.01 auf 0.03
-                logger.info(f"Kein Signal - Trend zu schwach: {trend}, Stärke: {strength:.3f}")
+                logger.info("Kein Signal - Trend zu schwach: %s, Stärke: %.3f", trend, strength)
                 return None
 
             # Support/Resistance Levels
@@ -364,15 +460,15 @@ class AutomatedSignalGenerator:
 
             # Erhöhte Mindest-Profitschwelle
             if expected_profit < 0.5:  # Erhöht von 0.1% auf 0.5%
-                logger.info(f"Kein Signal - Zu geringer erwarteter Profit: {expected_profit:.1f}%")
+                logger.info("Kein Signal - Zu geringer erwarteter Profit: %.1f%%", expected_profit)
                 return None
 
             signal_quality = self._calculate_signal_quality(
-                trend_analysis, strength, expected_profit
+                trend, metrics, volume_trend, expected_profit
             )
 
             if signal_quality < 4:  # Erhöht von 2 auf 4 für höhere Qualitätsanforderung
-                logger.info(f"Kein Signal - Qualität zu niedrig: {signal_quality}/10")
+                logger.info("Kein Signal - Qualität zu niedrig: %s/10", signal_quality)
                 return None
 
             return {
@@ -381,7 +477,7 @@ class AutomatedSignalGenerator:
                 'entry': entry,
                 'stop_loss': stop_loss,
                 'take_profit': take_profit,
-                'timestamp': datetime.now(pytz.UTC).timestamp(),
+                'timestamp': time.time(),
                 'token_address': "SOL",
                 'expected_profit': expected_profit,
                 'signal_quality': signal_quality,
@@ -392,62 +488,41 @@ class AutomatedSignalGenerator:
             }
 
         except Exception as e:
-            logger.error(f"Fehler bei der Signal-Erstellung: {e}")
+            logger.error("Fehler bei der Signal-Erstellung: %s", e)
             return None
 
-    def _calculate_signal_quality(self, trend_analysis: Dict[str, Any],
-                                  strength: float,
+    def _calculate_signal_quality(self, trend: str, metrics: Dict[str, Any],
+                                  volume_trend: float,
                                   expected_profit: float) -> float:
         """Berechnet die Qualität eines Signals (0-10) basierend auf technischer Analyse"""
         try:
-            # Grundlegende Trend-Bewertung
-            trend_base = float(8 if trend_analysis['trend'] == 'aufwärts' else 7)
-
-            # Trendstärke-Bewertung mit Berücksichtigung der Metriken
-            metrics = trend_analysis.get('metriken', {})
-            momentum = abs(float(metrics.get('momentum', 0)))
-            volatility = float(metrics.get('volatilität', 0))
-
-            # Momentum-basierte Stärkebewertung
-            strength_score = min(float(momentum * 20), 10.0)  # Erhöhte Sensitivität
-
-            # Volatilitäts-Anpassung
-            volatility_factor = max(0.5, 1.0 - float(volatility))  # Reduziere Score bei hoher Volatilität
-            strength_score *= volatility_factor
-
-            # Profit-Bewertung - Progressive Skala
-            expected_profit = float(expected_profit)
-            if expected_profit <= 1.0:
-                profit_score = expected_profit * 5  # 0.5% = 2.5 Punkte
-            elif expected_profit <= 2.0:
-                profit_score = 5 + (expected_profit - 1.0) * 3  # 1.5% = 6.5 Punkte
-            else:
-                profit_score = 8 + (min(expected_profit - 2.0, 2.0))  # Max 10 Punkte
-
-            # Volumen-Trend Bewertung
-            volume_trend = float(metrics.get('volumen_trend', 0))
-            volume_score = min(abs(volume_trend) * 10, 10.0)
-
-            # Gewichtete Summe mit Volumen-Einfluss
-            weights = (0.35, 0.25, 0.25, 0.15)  # Trend, Stärke, Profit, Volumen
-            quality = (
-                trend_base * weights[0] +         # Trend-Basis
-                strength_score * weights[1] +     # Trendstärke
-                profit_score * weights[2] +       # Profit-Potenzial
-                volume_score * weights[3]         # Volumen-Trend
+            inputs = (
+                float(metrics.get('momentum', 0)),
+                float(metrics.get('volatilität', 0)),
+                float(expected_profit),
+                float(volume_trend)
             )
-
-            logger.debug(f"Signal Qualitätsberechnung:"
-                        f"\n - Trend Score: {trend_base} (Gewicht: {weights[0]:.1f})"
-                        f"\n - Strength Score: {strength_score} (Gewicht: {weights[1]:.1f})"
-                        f"\n - Profit Score: {profit_score} (Gewicht: {weights[2]:.1f})"
-                        f"\n - Volume Score: {volume_score} (Gewicht: {weights[3]:.1f})"
-                        f"\n - Finale Qualität: {quality:.1f}/10")
-
-            return round(min(quality, 10.0), 1)
+            # NaN/inf aus lückenhaften Chart-Daten zählen wie fehlende Kennzahlen
+            momentum, volatility, profit, volume = (x if math.isfinite(x) else 0.0 for x in inputs)
+            trend_base, strength_score, profit_score, volume_score, quality = _quality_core(
+                TREND_BASE_SCORES.get(trend, 7.0), momentum, volatility, profit, volume
+            )
+            # Debug-Text nur bauen, wenn er auch ausgegeben wird
+            if logger.isEnabledFor(logging.DEBUG):
+                weights = QUALITY_WEIGHTS
+                logger.debug("Signal Qualitätsberechnung:"
+                            "\n - Trend Score: %s (Gewicht: %.1f)"
+                            "\n - Strength Score: %s (Gewicht: %.1f)"
+                            "\n - Profit Score: %s (Gewicht: %.1f)"
+                            "\n - Volume Score: %s (Gewicht: %.1f)"
+                            "\n - Finale Qualität: %.1f/10",
+                            trend_base, weights[0], strength_score, weights[1],
+                            profit_score, weights[2], volume_score, weights[3], quality)
+
+            return round(quality, 1)
 
         except Exception as e:
-            logger.error(f"Fehler bei der Qualitätsberechnung: {e}")
+            logger.error("Fehler bei der Qualitätsberechnung: %s", e)
             return 0.0
 
     def _notify_users_about_signal(self, signal: Dict[str, Any]):
@@ -500,24 +575,15 @@ class AutomatedSignalGenerator:
                         ]
                     ]
 
-                    if chart_image:
-                        # Sende Nachricht mit Chart
-                        self.bot.updater.bot.send_photo(
-                            chat_id=user_id,
-                            photo=chart_image,
-                            caption=signal_message,
-                            reply_markup=InlineKeyboardMarkup(keyboard)
-                        )
-                    else:
-                        # Sende Nachricht ohne Chart
-                        self.bot.updater.bot.send_message(
-                            chat_id=user_id,
-                            text=signal_message,
-                            reply_markup=InlineKeyboardMarkup(keyboard)
-                        )
-                    logger.info(f"Signal erfolgreich an User {user_id} gesendet")
+                    # Versand gedrosselt über die Warteschlange, mit Chart falls vorhanden
+                    self.notification_queue.enqueue(
+                        chat_id=user_id,
+                        caption=signal_message,
+                        photo=chart_image,
+                        reply_markup=InlineKeyboardMarkup(keyboard)
+                    )
                 except Exception as e:
-                    logger.error(f"Fehler beim Senden des Signals an User {user_id}: {e}")
+                    logger.error(f"Fehler beim Einreihen des Signals für User {user_id}: {e}")
 
         except Exception as e:
             logger.error(f"Fehler bei der Signal-Benachrichtigung: {e}")
\ No newline at end of file
@@ -5,11 +5,15 @@ import logging
 from datetime import datetime, timedelta
 import mplfinance as mpf
 import io
+import copy
 
 logger = logging.getLogger(__name__)
 
 class ChartAnalyzer:
     def __init__(self):
+        # Ergebnisse der Analysen je Datenstand, nach Methode
+        self._analysis_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._data_version = 0
         self.data = pd.DataFrame()
         self.last_update = None
         self.min_data_points = 2
@@ -30,6 +34,30 @@ class ChartAnalyzer:
             )
         )
 
+    @property
+    def data(self) -> pd.DataFrame:
+        return self._data
+
+    @data.setter
+    def data(self, value: pd.DataFrame):
+        # Jede neue Datenbasis macht zwischengespeicherte Analysen ungültig. Nur Zuweisungen
+        # zählen: In-place Änderungen (data.loc[...] = ..., data['close'] = ...) erhöhen die
+        # Version nicht und liefern weiter die alten Ergebnisse - dann neu zuweisen
+        self._data = value
+        self._data_version += 1
+
+    def _cached_analysis(self, name: str) -> Optional[Dict[str, Any]]:
+        """Liefert eine Kopie des Analyse-Ergebnisses zum aktuellen Datenstand, falls vorhanden"""
+        entry = self._analysis_cache.get(name)
+        if entry is not None and entry[0] == self._data_version:
+            return copy.deepcopy(entry[1])
+        return None
+
+    def _store_analysis(self, name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Legt ein Analyse-Ergebnis zum aktuellen Datenstand ab und gibt eine Kopie zurück"""
+        self._analysis_cache[name] = (self._data_version, result)
+        return copy.deepcopy(result)
+
     def update_price_data(self, dex_connector, token_address: str):
         """Aktualisiert die Preisdaten"""
         try:
@@ -75,6 +103,10 @@ class ChartAnalyzer:
 
     def analyze_trend(self) -> Dict[str, Any]:
         """Analysiert den aktuellen Trend mit erweiterten Metriken"""
+        cached = self._cached_analysis('trend')
+        if cached is not None:
+            return cached
+
         try:
             if len(self.data) < self.min_data_points:
                 logger.info(f"Zu wenig Daten für Trendanalyse (benötigt: {self.min_data_points})")
@@ -118,7 +150,7 @@ class ChartAnalyzer:
             }
 
             logger.info(f"Trendanalyse: {trend}, Stärke: {strength:.2f}")
-            return trend_data
+            return self._store_analysis('trend', trend_data)
 
         except Exception as e:
             logger.error(f"Fehler bei der Trendanalyse: {e}")
@@ -126,6 +158,10 @@ class ChartAnalyzer:
 
     def get_support_resistance(self) -> Dict[str, float]:
         """Berechnet Support und Resistance Levels mit Clustering"""
+        cached = self._cached_analysis('support_resistance')
+        if cached is not None:
+            return cached
+
         try:
             if len(self.data) < self.min_data_points * 2:
                 logger.info(f"Zu wenig Daten für Support/Resistance Berechnung")
@@ -170,7 +206,7 @@ class ChartAnalyzer:
 
             logger.info(f"Support/Resistance berechnet - Support: {support:.2f}, Resistance: {resistance:.2f}")
 
-            return {
+            levels_data = {
                 'support': support,
                 'resistance': resistance,
                 'levels': {
@@ -178,6 +214,7 @@ class ChartAnalyzer:
                     'resistance_levels': resistance_levels.tolist()
                 }
             }
+            return self._store_analysis('support_resistance', levels_data)
 
         except Exception as e:
             logger.error(f"Fehler bei der Support/Resistance Berechnung: {e}")
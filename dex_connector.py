@@ -2,7 +2,7 @@ import requests
 import logging
 from typing import Dict, Any, Tuple
 import json
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +60,7 @@ class DexConnector:
             market_data = {
                 'price': price,
                 'volume': float(data.get('volume24h', 1000000.0)),
-                'timestamp': datetime.now().timestamp()
+                'timestamp': time.time()
             }
 
             logger.info(f"SOL Marktdaten erfolgreich abgerufen - Preis: {market_data['price']:.2f} USDC")
@@ -1,10 +1,18 @@
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional, Sequence
 import numpy as np
+from numba import njit
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+
+@njit('float64(float64[:])', cache=True)
+def _volatility_core(prices):
+    """Variationskoeffizient der Preise (Standardabweichung / Mittelwert)"""
+    return np.std(prices) / np.mean(prices)
+
+
 class RiskAnalyzer:
     def __init__(self):
         self.risk_scores: Dict[str, float] = {}
@@ -141,11 +149,12 @@ class RiskAnalyzer:
             if not self.historical_data:
                 return 0.5
 
-            prices = [data['price'] for data in self.historical_data[-24:]]  # Letzte 24 Datenpunkte
-            if len(prices) < 2:
+            recent = self.historical_data[-24:]  # Letzte 24 Datenpunkte
+            if len(recent) < 2:
                 return 0.5
 
-            volatility = np.std(prices) / np.mean(prices)
+            prices = np.fromiter((data['price'] for data in recent), dtype=np.float64, count=len(recent))
+            volatility = _volatility_core(prices)
             return min(volatility / self.volatility_threshold, 1.0)
 
         except Exception as e:
@@ -184,17 +193,39 @@ class RiskAnalyzer:
 
     def update_market_data(self, price_data: Dict[str, Any]):
         """Aktualisiert die Marktdaten für Volatilitätsberechnungen"""
+        self.update_market_data_bulk([price_data.get('price')], [price_data.get('volume', 0)])
+
+    def update_market_data_bulk(self, prices: Sequence[float],
+                                volumes: Optional[Sequence[float]] = None,
+                                timestamps: Optional[Sequence[datetime]] = None):
+        """Übernimmt mehrere Preispunkte auf einmal und bereinigt die Historie nur einmal
+
+        Ohne timestamps erhalten alle Punkte den aktuellen Zeitpunkt, gelten also als
+        gleichzeitig erfasst und fallen gemeinsam aus dem 24-Stunden-Fenster.
+        """
         try:
-            self.historical_data.append({
-                'timestamp': datetime.now(),
-                'price': float(price_data['price']),
-                'volume': float(price_data.get('volume', 0))
-            })
+            prices = np.asarray(prices, dtype=np.float64)
+            volumes = (np.zeros_like(prices) if volumes is None
+                       else np.broadcast_to(np.asarray(volumes, dtype=np.float64), prices.shape))
+            # Fehlende Werte (None) werden zu NaN und würden die Volatilität verfälschen
+            if np.isnan(prices).any() or np.isnan(volumes).any():
+                raise ValueError("Ungültige Preis- oder Volumenangabe")
+
+            now = datetime.now()
+            if timestamps is None:
+                timestamps = [now] * len(prices)
+            elif len(timestamps) != len(prices):
+                raise ValueError("Anzahl der Zeitstempel und Preise stimmt nicht überein")
+
+            self.historical_data.extend(
+                {'timestamp': timestamp, 'price': price, 'volume': volume}
+                for timestamp, price, volume in zip(timestamps, prices.tolist(), volumes.tolist())
+            )
 
             # Behalte nur die letzten 24 Stunden
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            self.historical_data = [data for data in self.historical_data 
+            cutoff_time = now - timedelta(hours=24)
+            self.historical_data = [data for data in self.historical_data
                                   if data['timestamp'] > cutoff_time]
 
         except Exception as e:
-            logger.error(f"Fehler beim Aktualisieren der Marktdaten: {e}")
\ No newline at end of file
+            logger.error(f"Fehler beim Aktualisieren der Marktdaten: {e}")
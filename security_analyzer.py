@@ -3,18 +3,22 @@ from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 import hashlib
 import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Einmal pro Prozess kompiliert und von allen SecurityAnalyzer-Instanzen geteilt.
+# Bytes-Patterns: Wallet-Adressen sind ASCII, die 8-Bit-Suche ist schneller
+_SUSPICIOUS_PATTERNS: Dict[str, re.Pattern] = {
+    'known_scam': re.compile(rb'(?i)(scam|fake|free|airdrop|giveaway)'),
+    'suspicious_chars': re.compile(rb'[<>{}|\[\]`]'),
+    'rapid_tx': re.compile(rb'multiple_tx_\d+s'),
+    'unusual_amounts': re.compile(rb'unusual_amount_pattern')
+}
+
 class SecurityAnalyzer:
     def __init__(self):
         self.security_events: List[Dict[str, Any]] = []
-        self.suspicious_patterns: Dict[str, re.Pattern] = {
-            'known_scam': re.compile(r'(?i)(scam|fake|free|airdrop|giveaway)'),
-            'suspicious_chars': re.compile(r'[<>{}|\[\]`]'),
-            'rapid_tx': re.compile(r'multiple_tx_\d+s'),
-            'unusual_amounts': re.compile(r'unusual_amount_pattern')
-        }
 
         # Sicherheits-Schwellenwerte
         self.thresholds = {
@@ -27,26 +31,12 @@ class SecurityAnalyzer:
                              transaction_history: List[Dict[str, Any]]) -> Tuple[float, List[str]]:
         """Analysiert die Sicherheit einer Wallet"""
         try:
-            security_score = 100.0
-            warnings = []
-
-            # Analysiere Wallet-Adresse
-            address_score, address_warnings = self._analyze_address(wallet_address)
-            security_score *= address_score
-            warnings.extend(address_warnings)
-
-            # Analysiere Transaktionshistorie
-            if transaction_history:
-                history_score, history_warnings = self._analyze_transaction_history(transaction_history)
-                security_score *= history_score
-                warnings.extend(history_warnings)
-
-            # Prüfe auf bekannte Angriffsmuster
-            pattern_score, pattern_warnings = self._check_attack_patterns(wallet_address, transaction_history)
-            security_score *= pattern_score
-            warnings.extend(pattern_warnings)
+            subscores, warnings = self._collect_subscores(wallet_address, transaction_history)
 
-            # Normalisiere den Score auf 0-100
+            # Kombiniere die Teil-Scores und normalisiere auf 0-100
+            security_score = 100.0
+            for subscore in subscores:
+                security_score *= subscore
             security_score = max(min(security_score, 100), 0)
 
             # Logge Sicherheitsereignis
@@ -62,6 +52,69 @@ class SecurityAnalyzer:
             logger.error(f"Fehler bei der Sicherheitsanalyse: {e}")
             return 0.0, ["Fehler bei der Sicherheitsanalyse"]
 
+    def batch_analyze(self, wallet_addresses: List[str],
+                      histories: List[List[Dict[str, Any]]]) -> List[Tuple[float, List[str]]]:
+        """Analysiert die Sicherheit mehrerer Wallets mit vektorisierter Score-Berechnung"""
+        try:
+            if len(wallet_addresses) != len(histories):
+                raise ValueError("Anzahl der Wallets und Historien stimmt nicht überein")
+
+            all_subscores = []
+            all_warnings = []
+            for wallet_address, transaction_history in zip(wallet_addresses, histories):
+                subscores, warnings = self._collect_subscores(wallet_address, transaction_history)
+                all_subscores.append(subscores)
+                all_warnings.append(warnings)
+
+            if not all_subscores:
+                return []
+
+            # Ein Produkt über alle Wallets statt drei Multiplikationen pro Wallet
+            scores = self._combine_subscores(np.array(all_subscores, dtype=np.float64))
+
+            results = []
+            for wallet_address, score, warnings in zip(wallet_addresses, scores.tolist(), all_warnings):
+                self.log_security_event('wallet_analysis', {
+                    'wallet': wallet_address,
+                    'score': score,
+                    'warnings': warnings
+                })
+                results.append((score, warnings))
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Fehler bei der Batch-Sicherheitsanalyse: {e}")
+            return [(0.0, ["Fehler bei der Sicherheitsanalyse"]) for _ in wallet_addresses]
+
+    def _collect_subscores(self, wallet_address: str,
+                           transaction_history: List[Dict[str, Any]]) -> Tuple[Tuple[float, float, float], List[str]]:
+        """Sammelt Adress-, Historien- und Muster-Score einer Wallet"""
+        warnings = []
+
+        # Analysiere Wallet-Adresse
+        address_score, address_warnings = self._analyze_address(wallet_address)
+        warnings.extend(address_warnings)
+
+        # Analysiere Transaktionshistorie
+        history_score = 1.0
+        if transaction_history:
+            history_score, history_warnings = self._analyze_transaction_history(transaction_history)
+            warnings.extend(history_warnings)
+
+        # Prüfe auf bekannte Angriffsmuster
+        pattern_score, pattern_warnings = self._check_attack_patterns(wallet_address, transaction_history)
+        warnings.extend(pattern_warnings)
+
+        return (address_score, history_score, pattern_score), warnings
+
+    @staticmethod
+    def _combine_subscores(subscores: np.ndarray) -> np.ndarray:
+        """Kombiniert Teil-Scores (N x 3) als Produkt zu Scores auf 0-100"""
+        # Spaltenweise in derselben Reihenfolge wie analyze_wallet_security, damit beide Wege
+        # bitgleiche Scores liefern (np.prod würde die Multiplikationen umordnen)
+        return np.clip(100.0 * subscores[:, 0] * subscores[:, 1] * subscores[:, 2], 0.0, 100.0)
+
     def _check_attack_patterns(self, wallet_address: str, 
                             transaction_history: List[Dict[str, Any]]) -> Tuple[float, List[str]]:
         """Prüft auf bekannte Angriffsmuster"""
@@ -182,8 +235,9 @@ class SecurityAnalyzer:
                 warnings.append("⚠️ Ungewöhnliches Adressformat")
             
             # Überprüfe auf bekannte Muster
-            for pattern_name, pattern in self.suspicious_patterns.items():
-                if pattern.search(address):
+            address_bytes = address.encode('ascii', 'replace')
+            for pattern_name, pattern in _SUSPICIOUS_PATTERNS.items():
+                if pattern.search(address_bytes):
                     score *= 0.7
                     warnings.append(f"⚠️ Verdächtiges Muster gefunden: {pattern_name}")
             
@@ -200,25 +254,31 @@ class SecurityAnalyzer:
         warnings = []
         
         try:
-            recent_transactions = [tx for tx in history 
-                                 if datetime.now() - tx['timestamp'] < timedelta(hours=24)]
+            # Ein Durchlauf zählt aktuelle, kleine und nächtliche Transaktionen
+            cutoff = datetime.now() - timedelta(hours=24)
+            recent_count = small_tx_count = night_tx_count = 0
+            for tx in history:
+                timestamp = tx['timestamp']
+                if timestamp <= cutoff:
+                    continue
+                recent_count += 1
+                if float(tx.get('amount', 0)) < 0.01:
+                    small_tx_count += 1
+                if 1 <= timestamp.hour < 5:
+                    night_tx_count += 1
             
             # Überprüfe auf häufige kleine Transaktionen (mögl. Dust-Attacke)
-            small_tx_count = len([tx for tx in recent_transactions 
-                                if float(tx.get('amount', 0)) < 0.01])
             if small_tx_count > 5:
                 score *= 0.8
                 warnings.append("⚠️ Viele kleine Transaktionen - Mögliche Dust-Attacke")
             
             # Überprüfe auf ungewöhnliche Aktivitätszeiten
-            night_tx_count = len([tx for tx in recent_transactions 
-                                if tx['timestamp'].hour in range(1, 5)])
             if night_tx_count > 3:
                 score *= 0.9
                 warnings.append("⚠️ Ungewöhnliche Aktivitätszeiten")
             
             # Überprüfe auf schnelle aufeinanderfolgende Transaktionen
-            if len(recent_transactions) > 10:
+            if recent_count > 10:
                 score *= 0.9
                 warnings.append("⚠️ Hohe Transaktionsfrequenz")
             
@@ -1,113 +1,555 @@
 import logging
-from textblob import TextBlob
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-import nltk
-import requests
-from datetime import datetime, timedelta
-import json
-from typing import Dict, Any, Optional
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import aiohttp
+import httpx
+import orjson
+import msgspec
+import ijson
+from redis import asyncio as aioredis
+import copy
+import hashlib
+import os
+import random
+import re
+import string
+import time
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 import asyncio
+from array import array
+from functools import lru_cache
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-class SentimentAnalyzer:
-    def __init__(self):
-        """Initialisiert den Sentiment Analyzer"""
-        try:
-            # Stelle sicher, dass VADER Lexikon geladen ist
-            try:
-                nltk.data.find('sentiment/vader_lexicon.zip')
-            except LookupError:
-                nltk.download('vader_lexicon')
+# TTL (Sekunden) pro Datenquelle. Gilt für beide Cache-Ebenen: der Prozess-Cache übernimmt bei
+# einem Redis-Treffer nur die Rest-Laufzeit, Daten sind also nie älter als die TTL
+CACHE_POLICIES: Dict[str, int] = {
+    'coingecko_price': 10,
+    'dex_pairs': 60,
+    'social': 300
+}
+# Veraltete Kopien bleiben länger erhalten und dienen als Fallback bei API-Ausfällen
+STALE_TTL_FACTOR = 10
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Obergrenze für Wartezeiten aus Retry-After Headern (Sekunden)
+MAX_RETRY_AFTER = 30
+
+# Größere Antworten (z.B. DexScreener Pairs) werden außerhalb des Event Loops geparst
+LARGE_PAYLOAD_BYTES = 256 * 1024
+
+# Korrekte Solana Token Adresse
+SOL_TOKEN_ADDRESS = "So11111111111111111111111111111111111111112"
+
+# Unveränderliche Request-Bestandteile, einmal pro Prozess gebaut
+_DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (compatible; SolanaBot/1.0)',
+    'Accept': 'application/json'
+})
+_COINGECKO_PRICE_PARAMS = MappingProxyType({
+    'ids': 'solana',
+    'vs_currencies': 'usd',
+    'include_24hr_vol': 'true',
+    'include_24hr_change': 'true'
+})
+_MARKET_FALLBACK_URLS = (
+    "https://api.binance.com/api/v3/ticker/24hr?symbol=SOLUSDT",
+    "https://api.kucoin.com/api/v1/market/stats?symbol=SOL-USDT"
+)
+_SOCIAL_PARAMS = MappingProxyType({
+    'q': 'solana language:de OR language:en',
+    'since': '24h'
+})
+
+_VADER: Optional[SentimentIntensityAnalyzer] = None
+
+# Prozessweiter Verbindungspool mit DNS Cache, je Event Loop einer
+_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+_CONNECTOR_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_connector() -> aiohttp.TCPConnector:
+    """Liefert den gemeinsamen TCPConnector für den laufenden Event Loop"""
+    global _CONNECTOR, _CONNECTOR_LOOP
+    loop = asyncio.get_running_loop()
+    if _CONNECTOR is None or _CONNECTOR.closed or _CONNECTOR_LOOP is not loop:
+        if _CONNECTOR is not None and _CONNECTOR_LOOP is not loop:
+            _discard_connector(_CONNECTOR, _CONNECTOR_LOOP)
+        _CONNECTOR = aiohttp.TCPConnector(
+            limit=100, limit_per_host=3, ttl_dns_cache=300, use_dns_cache=True, keepalive_timeout=30
+        )
+        _CONNECTOR_LOOP = loop
+    return _CONNECTOR
+
+
+def _discard_connector(connector: aiohttp.TCPConnector, loop: Optional[asyncio.AbstractEventLoop]):
+    """Schließt den Verbindungspool eines nicht mehr genutzten Event Loops"""
+    if connector.closed:
+        return
+    try:
+        if loop is not None and loop.is_running():
+            # Loop läuft in einem anderen Thread weiter - dort regulär schließen
+            asyncio.run_coroutine_threadsafe(connector.close(), loop)
+        else:
+            # Loop beendet: Verbindungen ohne Warten auf den alten Loop verwerfen
+            connector._close()
+    except Exception as e:
+        logger.error(f"Fehler beim Schließen des alten Verbindungspools: {e}")
+
+
+async def close_shared_connector():
+    """Schließt den gemeinsamen Verbindungspool (beim Herunterfahren der Anwendung)"""
+    global _CONNECTOR, _CONNECTOR_LOOP
+    if _CONNECTOR is not None and not _CONNECTOR.closed:
+        await _CONNECTOR.close()
+    _CONNECTOR = None
+    _CONNECTOR_LOOP = None
+
+
+async def _parse_json(raw: bytes) -> Any:
+    """Parst JSON mit orjson, große Payloads in einem Worker-Thread"""
+    if len(raw) < LARGE_PAYLOAD_BYTES:
+        return orjson.loads(raw)
+    return await asyncio.get_running_loop().run_in_executor(None, orjson.loads, raw)
+
+
+# Geteiltes leeres Mapping statt eines neuen {} pro .get()-Fallback
+_EMPTY = MappingProxyType({})
+
+
+def _is_sol_pair(pair: Dict[str, Any], _get=dict.get) -> bool:
+    """Prüft, ob ein DexScreener Pair SOL als Base Token hat"""
+    return (_get(pair, 'baseToken') or _EMPTY).get('symbol', '').upper() == 'SOL'
+
+
+async def _stream_sol_usdc_pairs(response: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
+    """Liest 'pairs' als Stream und behält nur SOL/USDC Paare im Speicher"""
+    sol_pairs = []
+    async for pair in ijson.items_async(response.content, 'pairs.item', use_float=True):
+        if _is_sol_pair(pair) and (pair.get('quoteToken') or _EMPTY).get('symbol', '').upper() == 'USDC':
+            sol_pairs.append(pair)
+    return sol_pairs
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Wertet einen Retry-After Header aus (Sekunden oder HTTP-Datum)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
 
-            self.vader = SentimentIntensityAnalyzer()
+
+def _get_vader() -> Optional[SentimentIntensityAnalyzer]:
+    """Liefert den prozessweiten VADER Analyzer (lädt das Lexikon nur einmal)"""
+    global _VADER
+    if _VADER is None:
+        try:
+            # Das Lexikon liegt dem vaderSentiment-Paket bei, kein Download nötig
+            _VADER = SentimentIntensityAnalyzer()
         except Exception as e:
             logger.error(f"Fehler beim Laden von VADER: {e}")
-            self.vader = None
+            return None
+    return _VADER
+
+
+@lru_cache(maxsize=4096)
+def _vader_compound_cached(text: str) -> float:
+    """VADER Compound-Score, exakt gleiche Texte (z.B. Retweets) kommen aus dem Cache"""
+    return _VADER.polarity_scores(text)['compound']
+
+
+# TextBlob Pattern-Analyzer, prozessweit geteilt (siehe _get_textblob_analyzer)
+_TEXTBLOB_ANALYZER = None
+
+
+def _get_textblob_analyzer():
+    """Liefert den prozessweiten TextBlob Pattern-Analyzer; textblob wird erst beim ersten Bedarf importiert"""
+    global _TEXTBLOB_ANALYZER
+    if _TEXTBLOB_ANALYZER is None:
+        from textblob.en.sentiments import PatternAnalyzer
+        _TEXTBLOB_ANALYZER = PatternAnalyzer()
+    return _TEXTBLOB_ANALYZER
+
+
+@lru_cache(maxsize=4096)
+def _textblob_polarity(text: str) -> float:
+    """TextBlob Polarität (-1 bis 1), identisch zu TextBlob(text).sentiment.polarity"""
+    return _get_textblob_analyzer().analyze(text).polarity
+
+
+def _warmup_textblob():
+    """Lädt den TextBlob Pattern-Analyzer vorab, damit der erste Aufruf keinen Kaltstart zahlt"""
+    try:
+        _textblob_polarity("warmup")
+    except Exception as e:
+        logger.warning(f"TextBlob Warmup fehlgeschlagen: {e}")
+
+
+class Sentiment(msgspec.Struct):
+    """Sentiment-Ergebnis einer einzelnen Quelle"""
+    score: float
+    confidence: float
+    metrics: dict = {}
+
+
+class SentimentAnalyzer:
+    # Quellen: (Name, Fetch-Methode, Analyse-Methode, Gewichtung, erwarteter Ergebnistyp)
+    _SOURCES = (
+        ('coingecko', '_fetch_market_data', '_analyze_coingecko_sentiment', 0.4, dict),
+        ('social', '_fetch_social_data', '_analyze_social_sentiment', 0.3, str),
+        ('dex', '_fetch_dex_data', '_analyze_dex_sentiment', 0.3, dict),
+    )
+
+    def __init__(self, use_textblob: bool = False):
+        """Initialisiert den Sentiment Analyzer"""
+        # VADER wird prozessweit geteilt, das Lexikon nur einmal geladen
+        self.vader = _get_vader()
+
+        # Lexikon-Wörter für die schnelle Vorprüfung neutraler Texte
+        self._lex_keys = frozenset(self.vader.lexicon) if self.vader else frozenset()
+
+        # TextBlob nur auf Wunsch oder als Ersatz, falls VADER nicht verfügbar ist
+        self.use_textblob = use_textblob
+        if self._textblob_enabled:
+            _warmup_textblob()
 
         # API Endpoints mit korrekten URLs
         self.coingecko_api = "https://api.coingecko.com/api/v3"
         self.dex_screener_api = "https://api.dexscreener.com/latest/dex"
+        self.social_api = "https://api.example.com/social_data"  # REPLACE with actual social media API
 
         # API Konfiguration
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; SolanaBot/1.0)',
-            'Accept': 'application/json'
-        }
+        self.headers = _DEFAULT_HEADERS
 
         # Retry Konfiguration
         self.max_retries = 3
         self.retry_delay = 2
         self.timeout = 15
+        # Marktdaten-Fallbacks starten erst nach Fehlschlag oder dieser Frist (Sekunden) der vorherigen Quelle
+        self.market_fallback_delay = 2.0
+
+        # Drosselung: max. gleichzeitige Requests und Mindestabstand pro Host (Sekunden)
+        self.max_concurrent_requests = 6
+        self.min_request_interval = 0.2
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_next_request: Dict[str, float] = {}
+        # Nach einem 429 bleibt der Host bis zu diesem Zeitpunkt (Loop-Zeit) gesperrt
+        self._backoff_until: Dict[str, float] = {}
+
+        # HTTP Session wird beim ersten Request erstellt und wiederverwendet
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # CoinGecko läuft über HTTP/2: gleichzeitige Requests teilen eine TLS Verbindung
+        self._http2_client: Optional[httpx.AsyncClient] = None
+
+        # Hintergrund-Aktualisierung der Marktstimmung (siehe start())
+        self.refresh_interval = 15
+        self._last_sentiment: Optional[dict] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Laufende Requests (Single-Flight): Schlüssel -> [Task, Anzahl Wartende]
+        self._inflight: Dict[Tuple, List] = {}
+
+        # Optionaler Redis Cache für API-Antworten
+        redis_url = os.environ.get('REDIS_URL')
+        self.redis: Optional[aioredis.Redis] = aioredis.Redis.from_url(redis_url) if redis_url else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Prozess-Cache vor Redis: Schlüssel -> (Ablaufzeit nach time.monotonic, Daten)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+        # Letztes Social-Ergebnis: (Hash des Textes, Sentiment) - unveränderte Texte nicht neu analysieren
+        self._social_result: Optional[Tuple[bytes, Sentiment]] = None
+
+    @property
+    def _textblob_enabled(self) -> bool:
+        return self.use_textblob or not self.vader
+
+    @property
+    def coingecko_api(self) -> str:
+        return self._coingecko_api
+
+    @coingecko_api.setter
+    def coingecko_api(self, value: str):
+        # Endpoint-URLs werden nur bei Änderung der Basis-URL neu gebaut
+        self._coingecko_api = value
+        self._market_endpoints = ((f"{value}/simple/price", _COINGECKO_PRICE_PARAMS),) + tuple(
+            (endpoint, None) for endpoint in _MARKET_FALLBACK_URLS
+        )
+
+    @property
+    def dex_screener_api(self) -> str:
+        return self._dex_screener_api
+
+    @dex_screener_api.setter
+    def dex_screener_api(self, value: str):
+        self._dex_screener_api = value
+        self._url_dex_token = f"{value}/tokens/{SOL_TOKEN_ADDRESS}"
+        self._url_dex_pairs = f"{value}/pairs/solana"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Liefert die gemeinsame HTTP Session (TCP/TLS Verbindungen werden wiederverwendet)"""
+        connector = _get_connector()
+        # Session eines früheren Event Loops hängt noch am alten Verbindungspool
+        if self._session is not None and not self._session.closed and self._session.connector is not connector:
+            await self._session.close()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=connector,
+                connector_owner=False
+            )
+        return self._session
+
+    def _get_http2_client(self) -> httpx.AsyncClient:
+        """Liefert den gemeinsamen HTTP/2 Client für CoinGecko"""
+        if self._http2_client is None or self._http2_client.is_closed:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                headers=dict(self.headers),
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
+        return self._http2_client
+
+    async def close(self):
+        """Alias für aclose()"""
+        await self.aclose()
+
+    async def aclose(self):
+        """Stoppt die Hintergrund-Aktualisierung, schließt HTTP Session und Redis Verbindung"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+        self._http2_client = None
+
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    async def _cached_fetch(self, name: str, key_source: str,
+                            fetch: Callable[[], Awaitable[Any]],
+                            is_valid: Callable[[Any], bool] = bool) -> Any:
+        """Liefert Daten aus dem Prozess- bzw. Redis Cache oder ruft sie ab und legt sie dort ab"""
+        # Schlüssel hängt an der URL, eine geänderte API-URL umgeht alte Einträge
+        key = f"sent:{name}:{hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()}"
+        ttl = CACHE_POLICIES[name]
+
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now < entry[0]:
+            self.cache_hits += 1
+            logger.debug("Prozess-Cache Treffer für %s", name)
+            return entry[1]
+
+        if self.redis is None:
+            self.cache_misses += 1
+            data = await fetch()
+            if is_valid(data):
+                self._cache[key] = (now + ttl, data)
+            return data
 
-    def _analyze_text_sentiment(self, text: str) -> Dict[str, float]:
-        """Analysiert Text-Sentiment mit VADER und TextBlob"""
         try:
-            if not text:
-                return {'score': 0.5, 'confidence': 0}
+            cached = await self.redis.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.debug(f"Cache Treffer für {name}")
+                data = msgspec.json.decode(cached)
+                # Nur die Rest-Laufzeit aus Redis übernehmen, sonst wären die Daten bis zu 2x TTL alt
+                remaining = await self.redis.pttl(key)
+                if remaining > 0:
+                    self._cache[key] = (now + remaining / 1000, data)
+                return data
+        except Exception as e:
+            logger.warning(f"Redis Cache nicht verfügbar: {e}")
 
-            # VADER Analyse
-            if self.vader:
-                vader_scores = self.vader.polarity_scores(str(text))
-                vader_compound = vader_scores['compound']
-            else:
-                vader_compound = 0
+        self.cache_misses += 1
+        data = await fetch()
 
-            # TextBlob Analyse
-            blob = TextBlob(str(text))
-            textblob_score = blob.sentiment.polarity
+        try:
+            if is_valid(data):
+                self._cache[key] = (now + ttl, data)
+                payload = msgspec.json.encode(data)
+                await self.redis.setex(key, ttl, payload)
+                await self.redis.setex(f"{key}:stale", ttl * STALE_TTL_FACTOR, payload)
+            else:
+                stale = await self.redis.get(f"{key}:stale")
+                if stale is not None:
+                    logger.info(f"Verwende veraltete Cache-Daten für {name}")
+                    return msgspec.json.decode(stale)
+        except Exception as e:
+            logger.warning(f"Redis Cache nicht verfügbar: {e}")
 
-            # Kombiniere die Scores
-            combined_score = (vader_compound + textblob_score) / 2 if self.vader else textblob_score
-            normalized_score = (combined_score + 1) / 2  # Konvertiere zu [0,1]
+        return data
 
-            return {
-                'score': normalized_score,
-                'confidence': min(abs(vader_compound - textblob_score), 1) if self.vader else 0.5
-            }
+    def _analyze_text_sentiment(self, text: str) -> Dict[str, float]:
+        """Analysiert Text-Sentiment mit VADER, optional kombiniert mit TextBlob"""
+        try:
+            score, confidence = self._analyze_texts_sentiment([text])[0]
+            return {'score': float(score), 'confidence': float(confidence)}
 
         except Exception as e:
             logger.error(f"Fehler bei der Text-Sentiment-Analyse: {e}")
             return {'score': 0.5, 'confidence': 0}
 
+    def _analyze_texts_sentiment(self, texts: List[str]) -> np.ndarray:
+        """Analysiert mehrere Texte in einem Durchlauf, liefert (score, confidence) je Text"""
+        result = np.tile(np.array([0.5, 0.0]), (len(texts), 1))
+
+        # Zerlege alle Texte einmal in Sätze und merke den zugehörigen Text
+        sentences: List[str] = []
+        owners: List[int] = []
+        split = _SENTENCE_SPLIT_RE.split
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            if not isinstance(text, str):
+                text = str(text)
+            parts = [part for part in split(text) if part.strip()] or [text]
+            sentences.extend(parts)
+            owners.extend([index] * len(parts))
+
+        if not sentences:
+            return result
+
+        sentence_scores = self._sentence_scores
+        scores = np.array([sentence_scores(sentence) for sentence in sentences], dtype=np.float64)
+        owner_index = np.array(owners, dtype=np.intp)
+
+        # Mittelwert der Satz-Scores pro Text
+        counts = np.bincount(owner_index, minlength=len(texts))
+        has_text = counts > 0
+        vader_compound = np.bincount(owner_index, weights=scores[:, 0], minlength=len(texts))[has_text] / counts[has_text]
+        textblob_score = np.bincount(owner_index, weights=scores[:, 1], minlength=len(texts))[has_text] / counts[has_text]
+
+        # Kombiniere die Scores
+        if self.vader and self.use_textblob:
+            combined_score = (vader_compound + textblob_score) / 2
+            confidence = np.minimum(np.abs(vader_compound - textblob_score), 1)
+        elif self.vader:
+            # Nur VADER: Stärke des Compound-Scores als Konfidenz
+            combined_score = vader_compound
+            confidence = np.minimum(np.abs(vader_compound), 1)
+        else:
+            combined_score = textblob_score
+            confidence = 0.5
+
+        result[has_text, 0] = (combined_score + 1) / 2  # Konvertiere zu [0,1]
+        result[has_text, 1] = confidence
+        return result
+
+    def _sentence_scores(self, sentence: str) -> Tuple[float, float]:
+        """Liefert (VADER, TextBlob) Score eines Satzes, exakt gleiche Sätze aus dem Cache"""
+        if not self._textblob_enabled and not self._has_lexicon_hit(sentence.lower()):
+            # Ohne Lexikon-Treffer liefert VADER ohnehin 0 - Regelwerk überspringen
+            return 0.0, 0.0
+
+        # VADER Analyse - Cache nur für exakt gleiche Sätze, denn Großschreibung
+        # und Mentions verändern den Score ("GREAT NEWS @x" != "GREAT NEWS")
+        vader_compound = _vader_compound_cached(sentence) if self.vader else 0
+
+        # TextBlob Analyse (optional, sonst VADER Score übernehmen)
+        if self._textblob_enabled:
+            textblob_score = _textblob_polarity(sentence)
+        else:
+            textblob_score = vader_compound
+
+        return vader_compound, textblob_score
+
+    def _has_lexicon_hit(self, lowered: str) -> bool:
+        """Schnelle Prüfung, ob ein (kleingeschriebener) Satz überhaupt VADER-Lexikon-Wörter enthält"""
+        if not lowered.isascii():
+            # Emojis übersetzt VADER selbst in Wörter - keine Abkürzung
+            return True
+        words = lowered.split()
+        tokens = set(words)
+        tokens.update(word.strip(string.punctuation) for word in words)
+        return not tokens.isdisjoint(self._lex_keys)
+
+    async def start(self):
+        """Startet die Hintergrund-Aktualisierung der Marktstimmung"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+            logger.info(f"Sentiment Hintergrund-Aktualisierung gestartet (Intervall: {self.refresh_interval}s)")
+
+    async def _refresh_loop(self):
+        """Aktualisiert die Marktstimmung periodisch im Hintergrund"""
+        while True:
+            self._last_sentiment = await self._analyze_once()
+            await asyncio.sleep(self.refresh_interval)
+
     async def analyze_market_sentiment(self) -> dict:
+        """Liefert die Marktstimmung - aus der Hintergrund-Aktualisierung, falls aktiv"""
+        if self._refresh_task is not None and not self._refresh_task.done() and self._last_sentiment:
+            # Kopie: Änderungen des Aufrufers dürfen den geteilten Stand nicht verfälschen
+            return copy.deepcopy(self._last_sentiment)
+        return await self._analyze_once()
+
+    async def _analyze_once(self) -> dict:
         """Analysiert die Marktstimmung aus verschiedenen Quellen"""
         try:
             sentiment_data = {
                 'overall_score': 0,
                 'sources': {},
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
 
-            # Parallele API-Aufrufe
-            tasks = [
-                self._fetch_market_data(), # Replaced _fetch_coingecko_data
-                self._fetch_social_data(),
-                self._fetch_dex_data()
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Verarbeite die Ergebnisse
-            if isinstance(results[0], dict):
-                sentiment_data['sources']['coingecko'] = self._analyze_coingecko_sentiment(results[0])
-
-            if isinstance(results[1], str):
-                sentiment_data['sources']['social'] = self._analyze_social_sentiment(results[1])
-
-            if isinstance(results[2], dict):
-                sentiment_data['sources']['dex'] = self._analyze_dex_sentiment(results[2])
+            # Parallele API-Aufrufe aller Quellen
+            results = await asyncio.gather(
+                *(getattr(self, fetch)() for _, fetch, _, _, _ in self._SOURCES),
+                return_exceptions=True
+            )
 
-            # Berechne Gesamtscore mit Gewichtung
+            # Verarbeite die Ergebnisse und berechne Gesamtscore mit Gewichtung
+            sources: Dict[str, Sentiment] = {}
             scores = []
-            weights = {'coingecko': 0.4, 'social': 0.3, 'dex': 0.3}
-
-            for source, data in sentiment_data['sources'].items():
-                if isinstance(data, dict) and data.get('confidence', 0) > 0:
-                    scores.append(data['score'] * weights.get(source, 0.3))
+            active_weights = []
+            for (name, _, analyze, weight, result_type), result in zip(self._SOURCES, results):
+                if not isinstance(result, result_type):
+                    continue
+                data = sources[name] = getattr(self, analyze)(result)
+                if data.confidence > 0:
+                    scores.append(data.score)
+                    active_weights.append(weight)
+
+            # Nach außen bleiben die Quellen einfache Dicts
+            sentiment_data['sources'] = {
+                source: msgspec.structs.asdict(data) for source, data in sources.items()
+            }
 
             if scores:
-                sentiment_data['overall_score'] = sum(scores) / sum(weights.values())
+                # Gewichteter Mittelwert nur über die Quellen, die tatsächlich beitragen
+                weights = np.asarray(active_weights)
+                sentiment_data['overall_score'] = float(np.dot(scores, weights) / weights.sum())
                 logger.info(f"Sentiment Analyse abgeschlossen - Score: {sentiment_data['overall_score']:.2f}")
             else:
                 sentiment_data['overall_score'] = 0.5
@@ -119,73 +561,151 @@ class SentimentAnalyzer:
             logger.error(f"Fehler bei der Sentiment-Analyse: {e}")
             return {'overall_score': 0.5, 'sources': {}, 'error': str(e)}
 
-    async def _fetch_with_retry(self, url: str, params: Dict = None) -> Optional[requests.Response]:
-        """Generische Fetch-Funktion mit verbessertem Retry-Mechanismus"""
+    async def _fetch_with_retry(self, url: str, params: Dict = None, as_text: bool = False,
+                                reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+                                ) -> Optional[Tuple[int, Any]]:
+        """Generische Fetch-Funktion mit verbessertem Retry-Mechanismus
+
+        Liefert (Status, geparste Antwort) oder None, wenn keine gültige Antwort kam.
+        Mit reader wird der Body von dieser Funktion statt als Ganzes gelesen.
+        Gleichzeitige identische Anfragen teilen sich einen einzigen Request.
+        """
+        key = (url, tuple(sorted((params or {}).items())), as_text, reader)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.create_task(self._request_with_retry(url, params, as_text, reader))
+            inflight = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        task = inflight[0]
+        inflight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Letzter Wartender abgebrochen - der Request wird nicht mehr gebraucht
+            if inflight[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            inflight[1] -= 1
+
+    async def _send_request(self, url: str, params: Optional[Dict], as_text: bool,
+                            reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]],
+                            use_http2: bool) -> Tuple[int, Optional[str], Any]:
+        """Sendet einen einzelnen Request, liefert (Status, Retry-After, geparste Antwort bei 200)"""
+        if use_http2:
+            response = await self._get_http2_client().get(url, params=params, timeout=self.timeout)
+            if response.status_code == 200:
+                return response.status_code, None, await _parse_json(response.content)
+            return response.status_code, response.headers.get('Retry-After'), None
+
+        session = await self._get_session()
+        async with session.get(
+            url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            if response.status == 200:
+                if reader is not None:
+                    return response.status, None, await reader(response)
+                if as_text:
+                    return response.status, None, await response.text()
+                return response.status, None, await _parse_json(await response.read())
+            return response.status, response.headers.get('Retry-After'), None
+
+    async def _throttle(self, url: str):
+        """Wartet auf Mindestabstand und ggf. Rate-Limit-Sperre für den Host der URL"""
+        host = urlsplit(url).hostname or ''
+        now = asyncio.get_running_loop().time()
+        # Slot sofort reservieren, damit gleichzeitige Aufrufe sich hintereinander einreihen;
+        # während eines Rate Limits wartet jeder Request auf das Ende der Sperre
+        start = max(now, self._host_next_request.get(host, 0.0), self._backoff_until.get(host, 0.0))
+        self._host_next_request[host] = start + self.min_request_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _request_with_retry(self, url: str, params: Optional[Dict], as_text: bool,
+                                  reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+                                  ) -> Optional[Tuple[int, Any]]:
+        """Führt einen Request mit Retry-Mechanismus aus"""
+        use_http2 = url.startswith(self.coingecko_api) and reader is None and not as_text
+
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-
-                if response.status_code == 200:
-                    return response
-
-                if response.status_code == 429:  # Rate Limit
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.warning(f"Rate Limit erreicht - Warte {wait_time}s")
-                    await asyncio.sleep(wait_time)
+                await self._throttle(url)
+                async with self._request_semaphore:
+                    status, retry_after, payload = await self._send_request(url, params, as_text, reader, use_http2)
+                if status == 200:
+                    return status, payload
+
+                # Warte erst nach Freigabe der Verbindung und des Semaphors
+                is_last_attempt = attempt == self.max_retries - 1
+
+                if status == 429:  # Rate Limit
+                    if is_last_attempt:
+                        logger.warning(f"Rate Limit erreicht für URL: {url}")
+                        return None
+                    wait_time = _parse_retry_after(retry_after)
+                    if wait_time is None:
+                        wait_time = self.retry_delay * (2 ** attempt) + random.uniform(0, 0.5)
+                    wait_time = min(wait_time, MAX_RETRY_AFTER)
+
+                    # Host sperren: weitere Requests starten erst nach Ablauf (siehe _throttle)
+                    host = urlsplit(url).hostname or ''
+                    deadline = asyncio.get_running_loop().time() + wait_time
+                    self._backoff_until[host] = max(self._backoff_until.get(host, 0.0), deadline)
+
+                    logger.warning(f"Rate Limit erreicht - Warte {wait_time:.1f}s")
                     continue
 
-                if response.status_code == 404:
+                if status == 404:
                     logger.warning(f"Endpoint nicht gefunden: {url}")
                     return None
 
-                logger.warning(f"API Fehler: {response.status_code} für URL: {url}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                if status < 500:
+                    # Andere Client-Fehler werden durch Wiederholen nicht besser
+                    logger.warning(f"API Fehler: {status} für URL: {url}")
+                    return None
+
+                logger.warning(f"API Fehler: {status} für URL: {url}")
+                if not is_last_attempt:
+                    await asyncio.sleep(self.retry_delay / 2 + random.uniform(0, 0.5))
                     continue
 
                 return None
 
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, httpx.HTTPError, asyncio.TimeoutError, ValueError, ijson.JSONError) as e:
                 logger.error(f"Request Fehler für {url}: {e}")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(self.retry_delay + random.uniform(0, 0.5))
                     continue
                 return None
 
         return None
 
     async def _fetch_market_data(self) -> Dict[str, Any]:
+        """Holt Marktdaten (gecacht)"""
+        return await self._cached_fetch('coingecko_price', self.coingecko_api, self._request_market_data)
+
+    async def _request_market_data(self) -> Dict[str, Any]:
         """Holt Marktdaten mit Fallback-Mechanismen"""
+        pending: Dict[asyncio.Task, str] = {}
         try:
-            # Versuche primäre API
-            response = await self._fetch_with_retry(
-                f"{self.coingecko_api}/simple/price",
-                params={
-                    'ids': 'solana',
-                    'vs_currencies': 'usd',
-                    'include_24hr_vol': True,
-                    'include_24hr_change': True
-                }
-            )
-
-            if response and response.status_code == 200:
-                return response.json()
-
-            # Fallback: Versuche alternative APIs
-            alt_endpoints = [
-                "https://api.binance.com/api/v3/ticker/24hr?symbol=SOLUSDT",
-                "https://api.kucoin.com/api/v1/market/stats?symbol=SOL-USDT"
-            ]
+            # Nächste Quelle erst, wenn die laufenden scheitern oder die Frist überschreiten -
+            # so gehen bei funktionierender Primär-API keine zusätzlichen Requests raus
+            for endpoint, params in self._market_endpoints:
+                pending[asyncio.create_task(self._fetch_with_retry(endpoint, params))] = endpoint
+                data = await self._first_market_result(pending, self.market_fallback_delay)
+                if data:
+                    return data
 
-            for endpoint in alt_endpoints:
-                response = await self._fetch_with_retry(endpoint)
-                if response and response.status_code == 200:
-                    return self._normalize_market_data(response.json(), endpoint)
+            # Alle Quellen gestartet - auf die noch laufenden ohne Frist warten
+            data = await self._first_market_result(pending, None)
+            if data:
+                return data
 
             logger.warning("Keine Marktdaten verfügbar")
             return {}
@@ -194,6 +714,29 @@ class SentimentAnalyzer:
             logger.error(f"Fehler beim Abrufen der Marktdaten: {e}")
             return {}
 
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _first_market_result(self, pending: Dict[asyncio.Task, str],
+                                   timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Wartet, bis eine laufende Quelle Daten liefert, alle scheitern oder die Frist abläuft"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while pending:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                return None
+
+            # Bei gleichzeitig fertigen Quellen gilt die Reihenfolge der Endpoints
+            for task in [task for task in pending if task in done]:
+                endpoint = pending.pop(task)
+                response = task.result()
+                if response:
+                    return self._normalize_market_data(response[1], endpoint)
+        return None
+
     def _normalize_market_data(self, data: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Normalisiert Marktdaten von verschiedenen Quellen"""
         try:
@@ -216,40 +759,32 @@ class SentimentAnalyzer:
 
 
     async def _fetch_dex_data(self) -> Dict[str, Any]:
+        """Holt DEX-Daten für Solana (gecacht)"""
+        return await self._cached_fetch(
+            'dex_pairs', self.dex_screener_api, self._request_dex_data,
+            is_valid=lambda data: bool(data.get('pairs'))
+        )
+
+    async def _request_dex_data(self) -> Dict[str, Any]:
         """Holt DEX-Daten für Solana mit verbesserter Fehlerbehandlung"""
         try:
-            # Korrekte Solana Token Adresse
-            sol_token_address = "So11111111111111111111111111111111111111112"
-
             # Versuche zuerst die Token-spezifische API
-            response = await self._fetch_with_retry(
-                f"{self.dex_screener_api}/tokens/{sol_token_address}"
-            )
+            response = await self._fetch_with_retry(self._url_dex_token)
 
-            if response and response.status_code == 200:
-                data = response.json()
+            if response:
+                data = response[1]
                 if 'pairs' in data:
                     logger.info("DEX Daten erfolgreich abgerufen")
                     return data
 
-            # Fallback: Versuche die Top-Pairs API
-            response = await self._fetch_with_retry(
-                f"{self.dex_screener_api}/pairs/solana"
-            )
-
-            if response and response.status_code == 200:
-                data = response.json()
-                if 'pairs' in data:
-                    # Filtere nach SOL/USDC Paaren
-                    sol_pairs = [
-                        pair for pair in data['pairs']
-                        if (pair.get('baseToken', {}).get('symbol', '').upper() == 'SOL' and
-                            pair.get('quoteToken', {}).get('symbol', '').upper() == 'USDC')
-                    ]
+            # Fallback: Top-Pairs API, SOL/USDC Paare werden schon beim Parsen gefiltert
+            response = await self._fetch_with_retry(self._url_dex_pairs, reader=_stream_sol_usdc_pairs)
 
-                    if sol_pairs:
-                        logger.info("SOL/USDC Pairs gefunden")
-                        return {'pairs': sol_pairs}
+            if response:
+                sol_pairs = response[1]
+                if sol_pairs:
+                    logger.info("SOL/USDC Pairs gefunden")
+                    return {'pairs': sol_pairs}
 
             logger.warning("Keine SOL/USDC Paare gefunden")
             return {'pairs': []}
@@ -259,20 +794,22 @@ class SentimentAnalyzer:
             return {'pairs': []}
 
     async def _fetch_social_data(self) -> str:
+        """Holt Social Media Daten (gecacht)"""
+        return await self._cached_fetch('social', self.social_api, self._request_social_data)
+
+    async def _request_social_data(self) -> str:
         """Holt Social Media Daten mit Fallback-Mechanismen"""
         try:
             #Simplified to a single API call for testing purposes.  Replace with original logic if needed.
             response = await self._fetch_with_retry(
-                "https://api.example.com/social_data", #REPLACE with actual social media API
-                params={
-                    'q': 'solana language:de OR language:en',
-                    'since': '24h'
-                }
+                self.social_api,
+                params=_SOCIAL_PARAMS,
+                as_text=True
             )
 
-            if response and response.status_code == 200:
+            if response:
                 logger.info("Social Media Daten erfolgreich abgerufen")
-                return response.text
+                return response[1]
 
             logger.warning("Keine Social Media Daten gefunden.")
             return ""
@@ -283,93 +820,94 @@ class SentimentAnalyzer:
 
 
 
-    def _analyze_coingecko_sentiment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_coingecko_sentiment(self, data: Dict[str, Any]) -> Sentiment:
         """Analysiert CoinGecko Daten für Sentiment"""
         try:
             if not data:
-                return {'score': 0.5, 'confidence': 0}
+                return Sentiment(score=0.5, confidence=0)
 
-            price_change = data.get('usd_24h_change', 0) if 'solana' in data and data['solana'] else 0
-            volume = data.get('usd_24h_vol', 0) if 'solana' in data and data['solana'] else 0
+            has_solana = bool(data.get('solana'))
+            price_change = data.get('usd_24h_change', 0) if has_solana else 0
+            volume = data.get('usd_24h_vol', 0) if has_solana else 0
             price = data.get('solana', {}).get('usd', 0)
 
+            # Sentiment Score: 0.7 * (0.5 + Preisänderung/20) + 0.3 * Volumenfaktor (max. 1 Mrd),
+            # ausmultipliziert und auf 0-1 begrenzt
+            score = max(0.0, min(1.0, 0.35 + 0.035 * price_change + 0.3 * min(volume * 1e-9, 1.0)))
 
-            # Sentiment Score basierend auf Preis und Volumen
-            price_sentiment = 0.5 + (price_change / 20)  # Normalisiert auf -0.5 bis 1.5
-            volume_factor = min(volume / 1000000000, 1)  # Normalisiert auf 0-1
-
-            score = (price_sentiment * 0.7 + volume_factor * 0.3)
-            score = max(0, min(1, score))  # Begrenzt auf 0-1
-
-            return {
-                'score': score,
-                'confidence': 0.8,
-                'metrics': {
+            return Sentiment(
+                score=score,
+                confidence=0.8,
+                metrics={
                     'price_change': price_change,
                     'volume': volume,
                     'price': price
                 }
-            }
+            )
 
         except Exception as e:
             logger.error(f"Fehler bei der CoinGecko Sentiment-Analyse: {e}")
-            return {'score': 0.5, 'confidence': 0}
+            return Sentiment(score=0.5, confidence=0)
 
-    def _analyze_social_sentiment(self, text_data: str) -> Dict[str, Any]:
-        """Analysiert Social Media Text mit VADER und TextBlob"""
+    def _analyze_social_sentiment(self, text_data: str) -> Sentiment:
+        """Analysiert Social Media Text (VADER, optional mit TextBlob)"""
         try:
             if not text_data:
-                return {'score': 0.5, 'confidence': 0}
+                return Sentiment(score=0.5, confidence=0)
 
             # Bereinige Text und bereite ihn für die Analyse vor
-            text_data = ' '.join(text_data.split())  # Normalisiere Whitespace
-            text_data = text_data.replace('\n', ' ').strip()
+            text_data = _WHITESPACE_RE.sub(' ', text_data).strip()  # Normalisiere Whitespace
 
-            return self._analyze_text_sentiment(text_data)
+            digest = hashlib.blake2b(text_data.encode(), digest_size=16).digest()
+            if self._social_result is not None and self._social_result[0] == digest:
+                return self._social_result[1]
+
+            score, confidence = self._analyze_texts_sentiment([text_data])[0].tolist()
+            sentiment = Sentiment(score=score, confidence=confidence)
+            self._social_result = (digest, sentiment)
+            return sentiment
 
         except Exception as e:
             logger.error(f"Fehler bei der Social Media Sentiment-Analyse: {e}")
-            return {'score': 0.5, 'confidence': 0}
+            return Sentiment(score=0.5, confidence=0)
 
 
-    def _analyze_dex_sentiment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_dex_sentiment(self, data: Dict[str, Any]) -> Sentiment:
         """Analysiert DEX-Daten für Sentiment"""
         try:
             if 'pairs' not in data:
-                return {'score': 0.5, 'confidence': 0}
-
-            sol_pairs = [
-                pair for pair in data['pairs']
-                if pair.get('baseToken', {}).get('symbol', '').upper() == 'SOL'
-            ]
-
-            if not sol_pairs:
-                return {'score': 0.5, 'confidence': 0}
-
-            # Analysiere Handelsaktivität
-            total_volume = sum(float(pair.get('volume', {}).get('h24', 0)) for pair in sol_pairs)
-            price_changes = [
-                float(pair.get('priceChange', {}).get('h24', 0))
-                for pair in sol_pairs
-            ]
-
-            avg_price_change = sum(price_changes) / len(price_changes) if price_changes else 0
+                return Sentiment(score=0.5, confidence=0)
+
+            # Ein Durchlauf: filtern und Kennzahlen direkt in C-Arrays sammeln
+            volumes = array('d')
+            price_changes = array('d')
+            for pair in filter(_is_sol_pair, data['pairs']):
+                volumes.append(float((pair.get('volume') or _EMPTY).get('h24', 0)))
+                price_changes.append(float((pair.get('priceChange') or _EMPTY).get('h24', 0)))
+
+            if not volumes:
+                return Sentiment(score=0.5, confidence=0)
+
+            # Reduktionen in NumPy ohne Kopie der Puffer
+            pair_count = len(volumes)
+            total_volume = float(np.frombuffer(volumes, dtype=np.float64).sum())
+            avg_price_change = float(np.frombuffer(price_changes, dtype=np.float64).mean())
             volume_score = min(total_volume / 100000000, 1)  # Normalisiert auf 0-1
             price_score = 0.5 + (avg_price_change / 20)  # Normalisiert auf 0-1
 
             score = (volume_score * 0.4 + price_score * 0.6)
             score = max(0, min(1, score))
 
-            return {
-                'score': score,
-                'confidence': 0.7,
-                'metrics': {
+            return Sentiment(
+                score=score,
+                confidence=0.7,
+                metrics={
                     'total_volume': total_volume,
                     'avg_price_change': avg_price_change,
-                    'pair_count': len(sol_pairs)
+                    'pair_count': pair_count
                 }
-            }
+            )
 
         except Exception as e:
             logger.error(f"Fehler bei der DEX Sentiment-Analyse: {e}")
-            return {'score': 0.5, 'confidence': 0}
\ No newline at end of file
+            return Sentiment(score=0.5, confidence=0)
\ No newline at end of file
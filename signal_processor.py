@@ -1,15 +1,49 @@
 """SignalProcessor class for handling trading signals"""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Deque
 import logging
-from datetime import datetime
+import operator
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
 from chart_analyzer import ChartAnalyzer
 from risk_analyzer import RiskAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Maximale Anzahl gespeicherter Signale - ältere werden verdrängt
+MAX_STORED_SIGNALS = 10_000
+
+@dataclass(slots=True)
+class Signal:
+    """Verarbeitetes Trading Signal"""
+    timestamp: float
+    pair: str
+    direction: str
+    entry: float
+    stop_loss: float
+    take_profit: float
+    status: str
+    trend: str
+    trend_strength: float
+    expected_profit: float
+    signal_quality: float
+    risk_score: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 class SignalProcessor:
+    # Pflichtfelder eines eingehenden Signals
+    _REQUIRED = ('pair', 'direction', 'entry', 'stop_loss', 'take_profit')
+    _REQUIRED_FIELDS = frozenset(_REQUIRED)
+    _REQUIRED_GET = operator.itemgetter(*_REQUIRED)
+
     def __init__(self):
-        self.active_signals: List[Dict[str, Any]] = []
+        self.active_signals: Deque[Signal] = deque(maxlen=MAX_STORED_SIGNALS)
+        # Anzahl bereits verdrängter Signale = ID des ältesten gespeicherten Signals
+        self._evicted_signals = 0
+        # Signale je Status, nach ID in Einfügereihenfolge
+        self._by_status: Dict[str, Dict[int, Signal]] = {'neu': {}, 'ausgeführt': {}}
         self.chart_analyzer = ChartAnalyzer()
         self.risk_analyzer = RiskAnalyzer()
 
@@ -17,74 +51,114 @@ class SignalProcessor:
         """Verarbeitet ein eingehendes Trading Signal"""
         try:
             logger.info("Verarbeite neues Trading Signal")
-            logger.debug(f"Signal Eingangsdaten: {signal_data}")
+            logger.debug("Signal Eingangsdaten: %s", signal_data)
 
             # Validiere Signal-Daten
             if not self.validate_signal(signal_data):
                 logger.error("Signal-Validierung fehlgeschlagen")
                 return {}
 
-            # Verwende vorgegebene Werte für Test-Signale
-            trend_analysis = {
-                'trend': signal_data.get('direction', 'neutral'),
-                'stärke': signal_data.get('trend_strength', 0)
-            }
-
-            # Erstelle verarbeitetes Signal
-            processed_signal = {
-                'timestamp': datetime.now().timestamp(),
-                'pair': signal_data.get('pair', ''),
-                'direction': signal_data.get('direction', ''),
-                'entry': float(signal_data.get('entry', 0)),
-                'stop_loss': float(signal_data.get('stop_loss', 0)),
-                'take_profit': float(signal_data.get('take_profit', 0)),
-                'status': 'neu',
-                'trend': trend_analysis.get('trend', 'neutral'),
-                'trend_strength': trend_analysis.get('stärke', 0),
-                'expected_profit': signal_data.get('expected_profit', 0),
-                'signal_quality': signal_data.get('signal_quality', 0),
-                'risk_score': 5,  # Standard-Risikobewertung für Test-Signale
-            }
-
-            logger.info(f"Signal verarbeitet - Details:"
-                       f"\n - Pair: {processed_signal['pair']}"
-                       f"\n - Richtung: {processed_signal['direction']}"
-                       f"\n - Qualität: {processed_signal['signal_quality']}/10"
-                       f"\n - Trend: {processed_signal['trend']}"
-                       f"\n - Trendstärke: {processed_signal['trend_strength']:.2f}")
-
-            # Füge Signal zur aktiven Liste hinzu
-            self.active_signals.append(processed_signal)
-            logger.info(f"Signal akzeptiert: {processed_signal['pair']} "
-                       f"(Qualität: {processed_signal['signal_quality']}/10)")
-            return processed_signal
+            # Pflichtfelder sind validiert - einmal auslesen statt je Verwendung
+            pair, direction, entry, stop_loss, take_profit = self._REQUIRED_GET(signal_data)
+
+            # Erstelle verarbeitetes Signal, Trend entspricht bei Test-Signalen der Richtung
+            signal = Signal(
+                timestamp=time.time(),
+                pair=pair,
+                direction=direction,
+                entry=float(entry),
+                stop_loss=float(stop_loss),
+                take_profit=float(take_profit),
+                status='neu',
+                trend=direction,
+                trend_strength=signal_data.get('trend_strength', 0),
+                expected_profit=signal_data.get('expected_profit', 0),
+                signal_quality=signal_data.get('signal_quality', 0),
+                risk_score=5,  # Standard-Risikobewertung für Test-Signale
+            )
+
+            # Lazy formatiert: der Text wird nur gebaut, wenn INFO tatsächlich ausgegeben wird
+            logger.info("Signal verarbeitet - Details:"
+                       "\n - Pair: %s"
+                       "\n - Richtung: %s"
+                       "\n - Qualität: %s/10"
+                       "\n - Trend: %s"
+                       "\n - Trendstärke: %.2f",
+                       signal.pair, signal.direction, signal.signal_quality,
+                       signal.trend, signal.trend_strength)
+
+            self._store_signal(signal)
+            logger.info("Signal akzeptiert: %s (Qualität: %s/10)", signal.pair, signal.signal_quality)
+            return signal.to_dict()
 
         except Exception as e:
-            logger.error(f"Fehler bei der Signal-Verarbeitung: {e}")
+            logger.error("Fehler bei der Signal-Verarbeitung: %s", e)
             return {}
 
+    def process_signals_batch(self, signals: List[Dict[str, Any]],
+                              min_quality: float = 0.0) -> List[Dict[str, Any]]:
+        """Verarbeitet mehrere Signale, ungültige Signale werden einzeln übersprungen"""
+        results = []
+        for signal_data in signals:
+            if min_quality and not self._meets_quality(signal_data, min_quality):
+                continue
+            # process_signal validiert und fängt Fehler pro Signal ab
+            signal = self.process_signal(signal_data)
+            if signal:
+                results.append(signal)
+
+        logger.info("Batch verarbeitet: %d von %d Signalen akzeptiert", len(results), len(signals))
+        return results
+
+    @staticmethod
+    def _meets_quality(signal_data: Dict[str, Any], min_quality: float) -> bool:
+        """Prüft die Signalqualität, fehlende oder ungültige Werte erfüllen keine Schwelle"""
+        try:
+            return float(signal_data.get('signal_quality', 0)) >= min_quality
+        except (AttributeError, TypeError, ValueError):
+            return False
+
+    def _store_signal(self, signal: Signal) -> int:
+        """Speichert ein Signal und gibt seine ID zurück"""
+        signal_id = self._evicted_signals + len(self.active_signals)
+        if len(self.active_signals) == self.active_signals.maxlen:
+            # Ältestes Signal fällt aus dem Speicher
+            oldest = self.active_signals[0]
+            self._by_status[oldest.status].pop(self._evicted_signals, None)
+            self._evicted_signals += 1
+        self._by_status['neu'][signal_id] = signal
+        self.active_signals.append(signal)
+        return signal_id
+
     def validate_signal(self, signal_data: Dict[str, Any]) -> bool:
         """Überprüft ob ein Signal gültig ist"""
-        required_fields = ['pair', 'direction', 'entry', 'stop_loss', 'take_profit']
-        for field in required_fields:
-            if field not in signal_data:
-                logger.error(f"Fehlendes Pflichtfeld im Signal: {field}")
-                return False
-            if not signal_data[field]:
-                logger.error(f"Leeres Pflichtfeld im Signal: {field}")
-                return False
-        return True
+        # Mengenvergleich auf der Keys-View läuft vollständig in C
+        if not self._REQUIRED_FIELDS <= signal_data.keys():
+            missing = [field for field in self._REQUIRED if field not in signal_data]
+            logger.error("Fehlendes Pflichtfeld im Signal: %s", missing[0])
+            return False
+
+        values = self._REQUIRED_GET(signal_data)
+        if all(values):
+            return True
+
+        # Nur im Fehlerfall das leere Feld für die Meldung suchen
+        field = next(field for field, value in zip(self._REQUIRED, values) if not value)
+        logger.error("Leeres Pflichtfeld im Signal: %s", field)
+        return False
 
     def get_active_signals(self) -> List[Dict[str, Any]]:
         """Gibt alle aktiven Signale zurück"""
-        return [signal for signal in self.active_signals if signal['status'] == 'neu']
+        return [signal.to_dict() for signal in self._by_status['neu'].values()]
 
     def get_executed_signals(self) -> List[Dict[str, Any]]:
         """Gibt alle ausgeführten Signale zurück"""
-        return [signal for signal in self.active_signals if signal['status'] == 'ausgeführt']
+        return [signal.to_dict() for signal in self._by_status['ausgeführt'].values()]
 
     def mark_signal_executed(self, signal_id: int):
         """Markiert ein Signal als ausgeführt"""
-        if 0 <= signal_id < len(self.active_signals):
-            self.active_signals[signal_id]['status'] = 'ausgeführt'
-            logger.info(f"Signal {signal_id} als ausgeführt markiert")
\ No newline at end of file
+        signal = self._by_status['neu'].pop(signal_id, None)
+        if signal is not None:
+            self._by_status['ausgeführt'][signal_id] = signal
+            signal.status = 'ausgeführt'
+            logger.info("Signal %s als ausgeführt markiert", signal_id)
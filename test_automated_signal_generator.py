@@ -1,30 +1,61 @@
 import unittest
-from datetime import datetime, timedelta
-import pandas as pd
-import numpy as np
-from automated_signal_generator import AutomatedSignalGenerator
-from dex_connector import DexConnector
-from signal_processor import SignalProcessor
-from unittest.mock import MagicMock, patch, PropertyMock
-from chart_analyzer import ChartAnalyzer
+from datetime import datetime
+from automated_signal_generator import AutomatedSignalGenerator, NotificationQueue
+from unittest.mock import MagicMock
+from freezegun import freeze_time
+
+
+class _StubDex:
+    """Schlanker Ersatz für den DexConnector"""
+    def __init__(self):
+        self.market_info = {}
+
+    def get_market_info(self, token_address):
+        return self.market_info
+
+
+class _StubProcessor:
+    """Schlanker Ersatz für den SignalProcessor, zeichnet Aufrufe auf"""
+    def __init__(self):
+        self.calls = []
+
+    def process_signal(self, signal_data):
+        self.calls.append(signal_data)
+        return signal_data
+
+
+class _StubChartAnalyzer:
+    """Schlanker Ersatz für den ChartAnalyzer"""
+    def __init__(self):
+        self.chart = None
+
+    def create_prediction_chart(self, entry_price, target_price, stop_loss):
+        return self.chart
+
 
 class TestAutomatedSignalGenerator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Bot-Mock und Generator (inkl. Modelltraining) einmal für alle Tests"""
+        cls.bot = MagicMock()
+        cls.generator = AutomatedSignalGenerator(_StubDex(), _StubProcessor(), cls.bot)
+
     def setUp(self):
-        """Test Setup mit Mock-Objekten"""
-        self.dex_connector = MagicMock(spec=DexConnector)
-        self.signal_processor = MagicMock(spec=SignalProcessor)
-        self.bot = MagicMock()
+        """Test Setup mit Stub-Objekten"""
+        # Aufrufe und Konfiguration des geteilten Bot-Mocks zurücksetzen
+        self.bot.reset_mock(return_value=True, side_effect=True)
         self.bot.active_users = [12345]  # Test User ID
 
-        # Mock Chart Analyzer
-        self.chart_analyzer = MagicMock(spec=ChartAnalyzer)
+        self.dex_connector = _StubDex()
+        self.signal_processor = _StubProcessor()
 
-        self.generator = AutomatedSignalGenerator(
-            self.dex_connector,
-            self.signal_processor,
-            self.bot
-        )
+        # Stub Chart Analyzer
+        self.chart_analyzer = _StubChartAnalyzer()
+
+        self.generator.dex_connector = self.dex_connector
+        self.generator.signal_processor = self.signal_processor
         self.generator.chart_analyzer = self.chart_analyzer
+        self.generator.notification_queue = NotificationQueue(self.bot)
 
         # Mock Marktdaten
         self.market_data = {
@@ -32,11 +63,10 @@ class TestAutomatedSignalGenerator(unittest.TestCase):
             'volume': 1000000.0,
             'timestamp': datetime.now()
         }
-        self.dex_connector.get_market_info.return_value = self.market_data
+        self.dex_connector.market_info = self.market_data
 
     def test_signal_filtering(self):
         """Test der Signal-Filterung"""
-        # Test mit schwachem Signal
         weak_trend = {
             'trend': 'aufwärts',
             'stärke': 0.01,  # Sehr schwacher Trend
@@ -46,51 +76,45 @@ class TestAutomatedSignalGenerator(unittest.TestCase):
                 'volumen_trend': 0.1
             }
         }
-
-        # Mock der Zeitstempel-Generierung
-        with patch('time.time', return_value=1741471528.241259):
-            signal = self.generator._create_signal_from_analysis(
-                current_price=100.0,
-                trend_analysis=weak_trend,
-                support_resistance={'support': 98.0, 'resistance': 102.0}
-            )
-
-            # Schwaches Signal sollte gefiltert werden
-            self.assertIsNone(signal)
-
-            # Test mit starkem Signal
-            strong_trend = {
-                'trend': 'aufwärts',
-                'stärke': 0.8,
-                'metriken': {
-                    'momentum': 0.7,
-                    'volatilität': 0.2,
-                    'volumen_trend': 0.5
-                }
+        strong_trend = {
+            'trend': 'aufwärts',
+            'stärke': 0.8,
+            'metriken': {
+                'momentum': 0.7,
+                'volatilität': 0.2,
+                'volumen_trend': 0.5
             }
+        }
 
-            signal = self.generator._create_signal_from_analysis(
-                current_price=100.0,
-                trend_analysis=strong_trend,
-                support_resistance={'support': 98.0, 'resistance': 102.0}
-            )
-
-            # Starkes Signal sollte akzeptiert werden
-            self.assertIsNotNone(signal)
-            self.assertIn('signal_quality', signal)
-            self.assertGreater(signal['signal_quality'], 5)
+        # Alle Uhren (time.time, datetime.now, ...) einheitlich einfrieren
+        with freeze_time('2025-03-08 22:05:28.241259'):
+            for name, trend_analysis, expect_signal in (
+                ('schwach', weak_trend, False),  # Schwaches Signal sollte gefiltert werden
+                ('stark', strong_trend, True),  # Starkes Signal sollte akzeptiert werden
+            ):
+                with self.subTest(trend=name):
+                    signal = self.generator._create_signal_from_analysis(
+                        current_price=100.0,
+                        trend_analysis=trend_analysis,
+                        support_resistance={'support': 98.0, 'resistance': 102.0}
+                    )
+
+                    if not expect_signal:
+                        self.assertIsNone(signal)
+                        continue
+
+                    self.assertIsNotNone(signal)
+                    self.assertEqual(signal['timestamp'], 1741471528.241259)
+                    self.assertIn('signal_quality', signal)
+                    self.assertGreater(signal['signal_quality'], 5)
 
     def test_notification_system(self):
         """Test des Benachrichtigungssystems"""
         # Mock die Chart-Erstellung
-        self.chart_analyzer.create_prediction_chart.return_value = b"mock_chart_data"
+        self.chart_analyzer.chart = b"mock_chart_data"
 
-        # Mock für bot.updater.bot.send_photo
-        mock_bot = MagicMock()
-        mock_bot.send_photo = MagicMock()
-
-        self.bot.updater = MagicMock()
-        self.bot.updater.bot = mock_bot
+        # Mock der Versand-Warteschlange
+        self.generator.notification_queue = MagicMock()
 
         # Test Signal mit allen erforderlichen Feldern
         test_signal = {
@@ -111,18 +135,48 @@ class TestAutomatedSignalGenerator(unittest.TestCase):
 
         self.generator._notify_users_about_signal(test_signal)
 
-        # Überprüfe ob Benachrichtigung gesendet wurde
-        self.assertTrue(mock_bot.send_photo.called)
+        # Überprüfe ob je aktivem Nutzer eine Nachricht eingereiht wurde
+        enqueue = self.generator.notification_queue.enqueue
+        self.assertEqual(enqueue.call_count, len(self.bot.active_users))
 
         # Überprüfe Benachrichtigungsdetails
-        call_args = mock_bot.send_photo.call_args
-        self.assertIn('chat_id', call_args[1])
+        call_args = enqueue.call_args
+        self.assertEqual(call_args[1]['chat_id'], self.bot.active_users[0])
         self.assertIn('caption', call_args[1])
+        self.assertEqual(call_args[1]['photo'], b"mock_chart_data")
         self.assertIn('reply_markup', call_args[1])
 
-    def tearDown(self):
+    def test_notification_queue_sends_in_background(self):
+        """Test des gedrosselten Versands über die Warteschlange"""
+        notification_queue = NotificationQueue(self.bot, max_per_second=1000)
+
+        notification_queue.enqueue(chat_id=1, caption="mit Chart", photo=b"chart")
+        notification_queue.enqueue(chat_id=2, caption="ohne Chart")
+        notification_queue.close()
+
+        self.bot.updater.bot.send_photo.assert_called_once_with(
+            chat_id=1, photo=b"chart", caption="mit Chart", reply_markup=None
+        )
+        self.bot.updater.bot.send_message.assert_called_once_with(
+            chat_id=2, text="ohne Chart", reply_markup=None
+        )
+
+    def test_signal_quality_with_missing_metrics(self):
+        """Test, dass NaN/inf-Kennzahlen wie fehlende Werte bewertet werden"""
+        quality = self.generator._calculate_signal_quality
+        expected = quality('aufwärts', {}, 0.0, 1.0)
+
+        self.assertEqual(expected, 4.0)
+        self.assertEqual(
+            quality('aufwärts', {'momentum': float('nan'), 'volatilität': float('inf')}, float('nan'), 1.0),
+            expected
+        )
+        self.assertEqual(quality('aufwärts', {'momentum': 0.1, 'volatilität': 0.2}, 0.3, 1.5), 5.3)
+
+    @classmethod
+    def tearDownClass(cls):
         """Cleanup nach Tests"""
-        self.generator.stop()
+        cls.generator.stop()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,22 +1,35 @@
+import os
 import unittest
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from chart_analyzer import ChartAnalyzer
 
 class TestChartAnalyzer(unittest.TestCase):
-    def setUp(self):
-        self.analyzer = ChartAnalyzer()
-        # Erstelle Test-Daten
-        dates = pd.date_range(start='2025-01-01', end='2025-01-02', freq='1min')
-        self.test_data = pd.DataFrame({
-            'open': [100 + i * 0.1 for i in range(len(dates))],
-            'high': [100 + i * 0.15 for i in range(len(dates))],
-            'low': [100 + i * 0.05 for i in range(len(dates))],
-            'close': [100 + i * 0.1 for i in range(len(dates))],
-            'volume': [1000000 + i * 1000 for i in range(len(dates))],
+    @classmethod
+    def setUpClass(cls):
+        """Erstellt die Test-Daten einmal für alle Tests"""
+        dates = pd.date_range(start='2025-01-01', end='2025-01-02', freq='15min')
+        i = np.arange(len(dates), dtype=np.float64)
+        close = 100.0 + i * 0.1
+        cls._base_data = pd.DataFrame({
+            'open': close,
+            'high': 100.0 + i * 0.15,
+            'low': 100.0 + i * 0.05,
+            'close': close,
+            'volume': 1_000_000.0 + i * 1000.0,
             'timestamp': dates
         })
+        # Ein Analyzer (inkl. Chart-Styling) für alle Tests
+        cls.shared_analyzer = ChartAnalyzer()
+
+    def setUp(self):
+        self.analyzer = self.shared_analyzer
+        # Zustand früherer Tests verwerfen; neue Daten machen zwischengespeicherte Analysen ungültig
+        self.analyzer.last_support = None
+        self.analyzer.last_resistance = None
+        # Der Analyzer verändert die Daten nicht, eine flache Kopie genügt
+        self.test_data = self._base_data.copy(deep=False)
         self.analyzer.data = self.test_data
 
     def test_trend_analysis(self):
@@ -53,7 +66,54 @@ class TestChartAnalyzer(unittest.TestCase):
         self.assertLessEqual(result['resistance'], max_price * 1.05)
 
     def test_prediction_chart(self):
-        """Test der Chart-Erstellung"""
+        """Test der Chart-Erstellung ohne echtes Rendering"""
+        def fake_plot(df, savefig, hlines, **kwargs):
+            self.assertEqual(hlines['hlines'], [100.0, 105.0, 98.0])
+            savefig.write(b"\x89PNG stub")
+
+        with patch('chart_analyzer.mpf.plot', side_effect=fake_plot) as plot:
+            chart_data = self.analyzer.create_prediction_chart(
+                entry_price=100.0,
+                target_price=105.0,
+                stop_loss=98.0
+            )
+
+        # Überprüfe ob Chart erstellt wurde
+        plot.assert_called_once()
+        self.assertEqual(chart_data, b"\x89PNG stub")
+
+    def test_analysis_cache_invalidation(self):
+        """Test, dass neue Daten aus update_price_data zwischengespeicherte Analysen ersetzen"""
+        class StubDex:
+            price = 100.0
+
+            def get_market_info(self, token_address):
+                return {'price': self.price, 'volume': 1_000_000.0}
+
+        dex = StubDex()
+        self.analyzer.data = pd.DataFrame()
+        for price in (100.0, 101.0):
+            dex.price = price
+            self.analyzer.update_price_data(dex, "SOL")
+
+        first = self.analyzer.analyze_trend()
+        self.assertEqual(first['trend'], 'aufwärts')
+
+        # Änderungen am Ergebnis wirken sich nicht auf spätere Aufrufe aus
+        first['trend'] = 'abwärts'
+        first['metriken']['momentum'] = 0
+        cached = self.analyzer.analyze_trend()
+        self.assertEqual(cached['trend'], 'aufwärts')
+        self.assertNotEqual(cached['metriken']['momentum'], 0)
+
+        # Neue Daten über update_price_data machen den Cache ungültig
+        dex.price = 90.0
+        self.analyzer.update_price_data(dex, "SOL")
+        self.assertEqual(self.analyzer.analyze_trend()['trend'], 'abwärts')
+
+    @unittest.skipUnless(os.environ.get('RUN_SLOW_TESTS'), "Rendering nur mit RUN_SLOW_TESTS=1")
+    def test_prediction_chart_rendering(self):
+        """Test der echten Chart-Erstellung mit mplfinance"""
         entry_price = 100.0
         target_price = 105.0
         stop_loss = 98.0
@@ -71,7 +131,8 @@ class TestChartAnalyzer(unittest.TestCase):
 
     def test_empty_data_handling(self):
         """Test des Verhaltens bei leeren Daten"""
-        empty_analyzer = ChartAnalyzer()
+        empty_analyzer = self.analyzer
+        empty_analyzer.data = pd.DataFrame()
         
         # Teste Trendanalyse
         trend_result = empty_analyzer.analyze_trend()
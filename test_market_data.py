@@ -3,9 +3,6 @@ import logging
 from dex_connector import DexConnector
 from chart_analyzer import ChartAnalyzer
 from ai_trading_engine import AITradingEngine
-from datetime import datetime
-import time
-import pandas as pd
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -13,6 +10,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
 async def test_market_data():
     dex = DexConnector()
     analyzer = ChartAnalyzer()
@@ -25,39 +24,42 @@ async def test_market_data():
         market_data = await ai_engine.fetch_market_data()
         for api_name, data in market_data.items():
             if data:
-                logger.info(f"{api_name} API Test: Erfolgreich")
+                logger.info("%s API Test: Erfolgreich", api_name)
             else:
-                logger.warning(f"{api_name} API Test: Keine Daten")
+                logger.warning("%s API Test: Keine Daten", api_name)
     except Exception as e:
-        logger.error(f"Fehler beim API Test: {e}")
+        logger.error("Fehler beim API Test: %s", e)
+
+    # Test DEX price updates - die blockierenden Abrufe laufen parallel in Threads
+    market_infos = await asyncio.gather(
+        *(asyncio.to_thread(dex.get_market_info, SOL_MINT) for _ in range(5)),
+        return_exceptions=True
+    )
 
-    # Test DEX price updates
-    for i in range(5):
+    for i, market_info in enumerate(market_infos):
         try:
-            # Get market data
-            market_info = dex.get_market_info("So11111111111111111111111111111111111111112")
+            if isinstance(market_info, Exception):
+                raise market_info
+
             if market_info and market_info.get('price', 0) > 0:
                 price = market_info['price']
                 volume = market_info.get('volume', 0)
-                timestamp = datetime.now()
 
-                logger.info(f"[{i+1}/5] SOL Preis: {price:.2f} USDC, Volumen: {volume:.2f}")
+                logger.info("[%d/5] SOL Preis: %.2f USDC, Volumen: %.2f", i + 1, price, volume)
 
                 # Update chart data and analyze
                 analyzer.update_price_data(dex, "SOL")
                 trend = analyzer.analyze_trend()
-                logger.info(f"Trend Analyse: {trend}")
+                logger.info("Trend Analyse: %s", trend)
 
                 # Get support/resistance
                 levels = analyzer.get_support_resistance()
-                logger.info(f"Support/Resistance: {levels}")
+                logger.info("Support/Resistance: %s", levels)
             else:
                 logger.error("Keine gültigen Marktdaten erhalten")
 
         except Exception as e:
-            logger.error(f"Fehler in Test-Iteration {i+1}: {e}")
-
-        await asyncio.sleep(5)  # Warte 5 Sekunden zwischen Updates
+            logger.error("Fehler in Test-Iteration %d: %s", i + 1, e)
 
     logger.info("Marktdaten und API Test abgeschlossen")
 
@@ -1,7 +1,12 @@
 import unittest
 from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 from risk_analyzer import RiskAnalyzer
 
+# Vorzeichen +1, -1, +1, ... für 24 stündlich schwankende Preise
+ALTERNATING_SIGNS = np.where(np.arange(24) & 1, -1.0, 1.0)
+
 class TestRiskAnalyzer(unittest.TestCase):
     def setUp(self):
         self.risk_analyzer = RiskAnalyzer()
@@ -57,14 +62,8 @@ class TestRiskAnalyzer(unittest.TestCase):
         self.assertLess(tp_short, entry_price)  # Takeprofit unter Eintrittspreis
 
         # Test mit historischen Daten und hoher Volatilität
-        volatile_prices = [
-            {'timestamp': datetime.now() - timedelta(hours=i),
-             'price': 100.0 * (1 + ((-1)**i * 0.05)),  # ±5% Schwankung
-             'volume': 1000000.0}
-            for i in range(24)
-        ]
-        for price_data in volatile_prices:
-            self.risk_analyzer.update_market_data(price_data)
+        volatile_prices = 100.0 * (1 + ALTERNATING_SIGNS * 0.05)  # ±5% Schwankung
+        self.risk_analyzer.update_market_data_bulk(volatile_prices, 1000000.0)
 
         sl_volatile, tp_volatile = self.risk_analyzer.calculate_stoploss(entry_price, 'long')
         self.assertNotEqual(sl_volatile, entry_price * 0.95)  # Sollte nicht der Standard-Wert sein
@@ -92,11 +91,11 @@ class TestRiskAnalyzer(unittest.TestCase):
         self.assertIsInstance(recommendations, str)
 
         # Test mit hohem Risiko
+        # Viele Transaktionen in kurzer Zeit, Zeitstempel in einem Schritt erzeugt
+        timestamps = pd.date_range(end=datetime.now(), periods=12, freq='5min').to_pydatetime()
         high_risk_history = [
-            {'timestamp': datetime.now() - timedelta(minutes=i*5),
-             'amount': 50.0,
-             'type': 'send'}
-            for i in range(12)  # Viele Transaktionen in kurzer Zeit
+            {'timestamp': timestamp, 'amount': 50.0, 'type': 'send'}
+            for timestamp in timestamps
         ]
         high_risk_score, high_risk_recommendations = self.risk_analyzer.analyze_transaction_risk(
             1000.0,  # Hoher Betrag
@@ -108,31 +107,47 @@ class TestRiskAnalyzer(unittest.TestCase):
     def test_market_volatility(self):
         """Test der Marktvolatilitätsberechnung"""
         # Test mit stabilen Preisen
-        stable_prices = [
-            {'timestamp': datetime.now() - timedelta(hours=i),
-             'price': 100.0,
-             'volume': 1000000.0}
-            for i in range(24)
-        ]
-        for price_data in stable_prices:
-            self.risk_analyzer.update_market_data(price_data)
+        stable_prices = np.full(24, 100.0)
+        self.risk_analyzer.update_market_data_bulk(stable_prices, 1000000.0)
 
         volatility = self.risk_analyzer._calculate_market_volatility()
         self.assertLess(volatility, 0.5)  # Niedrige Volatilität erwartet
 
         # Test mit volatilen Preisen
-        volatile_prices = [
-            {'timestamp': datetime.now() - timedelta(hours=i),
-             'price': 100.0 * (1 + ((-1)**i * 0.1)),  # ±10% Schwankung
-             'volume': 1000000.0}
-            for i in range(24)
-        ]
+        volatile_prices = 100.0 * (1 + ALTERNATING_SIGNS * 0.1)  # ±10% Schwankung
         self.risk_analyzer.historical_data = []  # Reset historical data
-        for price_data in volatile_prices:
-            self.risk_analyzer.update_market_data(price_data)
+        self.risk_analyzer.update_market_data_bulk(volatile_prices, 1000000.0)
 
         high_volatility = self.risk_analyzer._calculate_market_volatility()
         self.assertGreater(high_volatility, volatility)  # Höhere Volatilität erwartet
 
+    def test_market_data_updates(self):
+        """Test der Marktdaten-Historie: Zeitstempel, 24h-Fenster und ungültige Eingaben"""
+        self.risk_analyzer.historical_data = []
+        now = datetime.now()
+        timestamps = pd.date_range(end=now, periods=4, freq='10h').to_pydatetime()
+
+        # Eigene Zeitstempel bleiben erhalten, Punkte älter als 24h werden verworfen
+        self.risk_analyzer.update_market_data_bulk([100.0, 101.0, 102.0, 103.0], 5.0, timestamps)
+        self.assertEqual([data['price'] for data in self.risk_analyzer.historical_data], [101.0, 102.0, 103.0])
+        self.assertEqual(self.risk_analyzer.historical_data[0]['timestamp'], timestamps[1])
+        self.assertEqual(self.risk_analyzer.historical_data[0]['volume'], 5.0)
+
+        # Einzelner Punkt läuft über denselben Weg
+        self.risk_analyzer.update_market_data({'price': 104.0})
+        self.assertEqual(self.risk_analyzer.historical_data[-1]['price'], 104.0)
+        self.assertEqual(self.risk_analyzer.historical_data[-1]['volume'], 0.0)
+
+        # Ungültige Eingaben werden protokolliert und ändern die Historie nicht
+        for name, update in (
+            ('ohne Preis', lambda: self.risk_analyzer.update_market_data({'volume': 1.0})),
+            ('Preis kein Wert', lambda: self.risk_analyzer.update_market_data({'price': 'abc'})),
+            ('Zeitstempel fehlen', lambda: self.risk_analyzer.update_market_data_bulk([1.0, 2.0], None, [now])),
+        ):
+            with self.subTest(case=name):
+                with self.assertLogs('risk_analyzer', level='ERROR'):
+                    update()
+                self.assertEqual(len(self.risk_analyzer.historical_data), 4)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
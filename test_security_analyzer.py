@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timedelta
+from freezegun import freeze_time
+from security_analyzer import SecurityAnalyzer
+
+# Gültiges Adressformat (44 Zeichen) ohne verdächtige Muster
+VALID_ADDRESS = "a" * 44
+
+
+class TestSecurityAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = SecurityAnalyzer()
+
+    def _small_tx_history(self, count):
+        """Erzeugt count kleine Transaktionen der letzten Minuten"""
+        now = datetime.now()
+        return [
+            {'timestamp': now - timedelta(minutes=i), 'amount': 0.005, 'type': 'send'}
+            for i in range(count)
+        ]
+
+    def test_wallet_security_scores(self):
+        """Test der Sicherheitsbewertung einzelner Wallets"""
+        with freeze_time('2025-03-08 12:00:00'):
+            cases = (
+                # (Name, Adresse, Historie, erwarteter Score, Anzahl Warnungen);
+                # Scores exakt wie das Produkt 100 * Adresse * Historie * Muster
+                ('sauber', VALID_ADDRESS, [], 100.0, 0),
+                ('ungültiges Format', 'short', [], 50.0, 1),
+                ('Betrugsmuster', 'free_scam_wallet', [], 35.0, 2),
+                ('viele kleine Transaktionen', VALID_ADDRESS, self._small_tx_history(12), 100.0 * (0.8 * 0.9), 2),
+            )
+            for name, address, history, expected_score, warning_count in cases:
+                with self.subTest(case=name):
+                    score, warnings = self.analyzer.analyze_wallet_security(address, history)
+                    self.assertEqual(score, expected_score)
+                    self.assertEqual(len(warnings), warning_count)
+
+    def test_batch_matches_single_analysis(self):
+        """Test, dass batch_analyze dieselben Ergebnisse wie Einzelanalysen liefert"""
+        with freeze_time('2025-03-08 12:00:00'):
+            addresses = [VALID_ADDRESS, 'short', 'free_scam_wallet', VALID_ADDRESS]
+            histories = [[], [], self._small_tx_history(6), self._small_tx_history(12)]
+
+            batch_results = self.analyzer.batch_analyze(addresses, histories)
+            single_results = [
+                self.analyzer.analyze_wallet_security(address, history)
+                for address, history in zip(addresses, histories)
+            ]
+
+        self.assertEqual(batch_results, single_results)
+        # Jede Analyse wird als Sicherheitsereignis protokolliert
+        self.assertEqual(len(self.analyzer.security_events), 2 * len(addresses))
+
+    def test_batch_edge_cases(self):
+        """Test von leerer Eingabe und ungleichen Längen"""
+        self.assertEqual(self.analyzer.batch_analyze([], []), [])
+
+        results = self.analyzer.batch_analyze([VALID_ADDRESS, 'short'], [[]])
+        self.assertEqual(results, [(0.0, ["Fehler bei der Sicherheitsanalyse"])] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,94 @@
 import unittest
-from datetime import datetime
 import asyncio
-from sentiment_analyzer import SentimentAnalyzer
-import nltk
+import time
+from unittest.mock import AsyncMock
+from freezegun import freeze_time
+from redis.exceptions import ConnectionError as RedisConnectionError
+from textblob import TextBlob
+from sentiment_analyzer import (
+    SentimentAnalyzer, Sentiment, CACHE_POLICIES, MAX_RETRY_AFTER, STALE_TTL_FACTOR,
+    _get_vader, _parse_retry_after, _textblob_polarity, close_shared_connector
+)
+
+class _FakeResponse:
+    """Ersatz für aiohttp.ClientResponse"""
+    def __init__(self, status, headers, body, delay):
+        self.status = status
+        self.headers = headers
+        self._body = body
+        self._delay = delay
+
+    async def __aenter__(self):
+        await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self._body
+
+    async def text(self):
+        return self._body.decode()
+
+
+class _FakeSession:
+    """Ersatz für aiohttp.ClientSession: Antworten je URL der Reihe nach, Requests mit Loop-Zeit aufgezeichnet"""
+    def __init__(self, responses, delay=0.0):
+        self.responses = {url: list(answers) for url, answers in responses.items()}
+        self.delay = delay
+        self.requests = []
+        self.closed = False
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append((url, asyncio.get_running_loop().time()))
+        answers = self.responses[url]
+        status, headers = answers.pop(0) if len(answers) > 1 else answers[0]
+        return _FakeResponse(status, headers, b'{"ok": true}', self.delay)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeRedis:
+    """Ersatz für redis.asyncio.Redis mit Ablaufzeiten über time.monotonic"""
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.store = {}
+        self.ttls = {}
+        self.gets = 0
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("Redis nicht erreichbar")
+
+    async def get(self, key):
+        self._check()
+        self.gets += 1
+        entry = self.store.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def setex(self, key, ttl, value):
+        self._check()
+        self.ttls[key] = ttl
+        self.store[key] = (time.monotonic() + ttl, value)
+
+    async def pttl(self, key):
+        self._check()
+        entry = self.store.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return -2
+        return int((entry[0] - time.monotonic()) * 1000)
+
+    async def aclose(self):
+        pass
+
 
 class TestSentimentAnalyzer(unittest.TestCase):
     def setUp(self):
-        """Test Setup mit NLTK Download"""
-        try:
-            nltk.data.find('sentiment/vader_lexicon.zip')
-        except LookupError:
-            nltk.download('vader_lexicon')
+        """Test Setup, der VADER Analyzer wird prozessweit wiederverwendet"""
         self.analyzer = SentimentAnalyzer()
 
     def test_text_sentiment(self):
@@ -48,8 +126,27 @@ class TestSentimentAnalyzer(unittest.TestCase):
                     self.assertIn('score', sources[source])
                     self.assertIn('confidence', sources[source])
 
+            await self.analyzer.aclose()
+
         asyncio.run(run_test())
 
+    def test_overall_score_uses_active_weights(self):
+        """Test des Gesamtscores, wenn nur ein Teil der Quellen liefert"""
+        async def market_data():
+            return {'solana': {'usd': 100}, 'usd_24h_change': 2, 'usd_24h_vol': 0}
+
+        async def failing_source():
+            raise RuntimeError("Quelle nicht erreichbar")
+
+        self.analyzer._fetch_market_data = market_data
+        self.analyzer._fetch_social_data = failing_source
+        self.analyzer._fetch_dex_data = failing_source
+
+        result = asyncio.run(self.analyzer.analyze_market_sentiment())
+
+        self.assertEqual(list(result['sources']), ['coingecko'])
+        self.assertAlmostEqual(result['overall_score'], result['sources']['coingecko']['score'])
+
     def test_empty_data_handling(self):
         """Test der Fehlerbehandlung bei leeren Daten"""
         # Test mit leerem Text
@@ -69,6 +166,43 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertEqual(invalid_result['score'], 0.5)
         self.assertEqual(invalid_result['confidence'], 0)
 
+    def test_capitalization_not_shared_between_sentences(self):
+        """Test, dass Groß-/Kleinschreibung den Score nicht aus dem Cache eines anderen Satzes erbt"""
+        vader = _get_vader()
+        for order in (("This is GREAT", "this is great"), ("this is great", "This is GREAT")):
+            with self.subTest(order=order):
+                analyzer = SentimentAnalyzer()
+                for sentence in order:
+                    expected = (vader.polarity_scores(sentence)['compound'] + 1) / 2
+                    result = analyzer._analyze_text_sentiment(sentence)
+                    self.assertAlmostEqual(result['score'], expected)
+
+        # Großschreibung wirkt bei VADER als Betonung
+        self.assertGreater(
+            self.analyzer._analyze_text_sentiment("This is GREAT")['score'],
+            self.analyzer._analyze_text_sentiment("this is great")['score']
+        )
+
+    def test_textblob_polarity_matches_textblob(self):
+        """Test, dass die TextBlob Polarität exakt TextBlob entspricht"""
+        cases = (
+            "not very good",  # Verneinung vor Verstärker
+            "This coin is NOT good!!!",  # Verneinung und Ausrufezeichen
+            "I hate this :(",  # Emoticon
+            "Solana is very very good :)",  # Verstärker und Emoticon
+            "This is terribly bad news!",  # abgeleitetes Adverb
+            "Nothing to see here",
+        )
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertEqual(_textblob_polarity(text), TextBlob(text).sentiment.polarity)
+
+        analyzer = SentimentAnalyzer(use_textblob=True)
+        vader = _get_vader()
+        text = "This coin is NOT good!!!"
+        expected = ((vader.polarity_scores(text)['compound'] + TextBlob(text).sentiment.polarity) / 2 + 1) / 2
+        self.assertAlmostEqual(analyzer._analyze_text_sentiment(text)['score'], expected)
+
     def test_dex_data_fetching(self):
         """Test der DEX Daten Abrufung"""
         async def run_test():
@@ -89,11 +223,12 @@ class TestSentimentAnalyzer(unittest.TestCase):
             }
 
             sentiment = self.analyzer._analyze_dex_sentiment(test_data)
-            self.assertIsInstance(sentiment, dict)
-            self.assertIn('score', sentiment)
-            self.assertIn('confidence', sentiment)
-            self.assertGreaterEqual(sentiment['score'], 0)
-            self.assertLessEqual(sentiment['score'], 1)
+            self.assertIsInstance(sentiment, Sentiment)
+            self.assertGreaterEqual(sentiment.confidence, 0)
+            self.assertGreaterEqual(sentiment.score, 0)
+            self.assertLessEqual(sentiment.score, 1)
+
+            await self.analyzer.aclose()
 
         asyncio.run(run_test())
 
@@ -112,7 +247,384 @@ class TestSentimentAnalyzer(unittest.TestCase):
             self.assertIn('pairs', result)
             self.assertEqual(len(result['pairs']), 0)
 
+            await self.analyzer.aclose()
+
         asyncio.run(run_test())
 
+class TestRequestHandling(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+        self.analyzer.min_request_interval = 0
+        self.analyzer.retry_delay = 0.01
+
+    def test_rate_limited_host_blocks_only_itself(self):
+        """Test, dass nach einem 429 nur der betroffene Host bis Retry-After gesperrt ist"""
+        limited_url = "https://api.host-a.test/limited"
+        other_same_host = "https://api.host-a.test/other"
+        other_host = "https://api.host-b.test/data"
+        session = _FakeSession({
+            limited_url: [(429, {'Retry-After': '0.3'}), (200, {})],
+            other_same_host: [(200, {})],
+            other_host: [(200, {})],
+        })
+        self.analyzer._get_session = AsyncMock(return_value=session)
+
+        async def run_test():
+            loop = asyncio.get_running_loop()
+            limited = asyncio.create_task(self.analyzer._fetch_with_retry(limited_url))
+            await asyncio.sleep(0.05)  # 429 ist eingegangen, Host A gesperrt
+            blocked_at = loop.time()
+
+            same_host, other = await asyncio.gather(
+                self.analyzer._fetch_with_retry(other_same_host),
+                self.analyzer._fetch_with_retry(other_host)
+            )
+            self.assertEqual(await limited, (200, {'ok': True}))
+            self.assertEqual(same_host, (200, {'ok': True}))
+            self.assertEqual(other, (200, {'ok': True}))
+            return blocked_at
+
+        blocked_at = asyncio.run(run_test())
+        sent = {}
+        for url, at in session.requests:
+            sent.setdefault(url, []).append(at)
+
+        first_429 = sent[limited_url][0]
+        # Host A: Wiederholung und andere URL erst nach Ablauf von Retry-After
+        self.assertGreaterEqual(sent[limited_url][1] - first_429, 0.29)
+        self.assertGreaterEqual(sent[other_same_host][0] - first_429, 0.29)
+        # Host B wird nicht blockiert
+        self.assertLess(sent[other_host][0] - blocked_at, 0.1)
+
+    def test_concurrent_identical_fetches_share_one_request(self):
+        """Test des Single-Flight: gleiche Requests teilen sich eine Anfrage, Abbruch betrifft nur den Wartenden"""
+        url = "https://api.host-a.test/shared"
+        session = _FakeSession({url: [(200, {})]}, delay=0.1)
+        self.analyzer._get_session = AsyncMock(return_value=session)
+
+        async def run_test():
+            waiters = [asyncio.create_task(self.analyzer._fetch_with_retry(url)) for _ in range(3)]
+            await asyncio.sleep(0.02)
+
+            # Ein Wartender bricht ab, die übrigen erhalten trotzdem das Ergebnis
+            waiters[0].cancel()
+            results = await asyncio.gather(*waiters, return_exceptions=True)
+            self.assertIsInstance(results[0], asyncio.CancelledError)
+            self.assertEqual(results[1:], [(200, {'ok': True})] * 2)
+            self.assertEqual(self.analyzer._inflight, {})
+
+            # Bricht der letzte Wartende ab, wird auch der Request abgebrochen
+            last = asyncio.create_task(self.analyzer._fetch_with_retry(url))
+            await asyncio.sleep(0.02)
+            inflight_task = next(iter(self.analyzer._inflight.values()))[0]
+            last.cancel()
+            await asyncio.gather(last, return_exceptions=True)
+            await asyncio.sleep(0)
+            self.assertTrue(inflight_task.cancelled())
+
+        asyncio.run(run_test())
+        self.assertEqual(len(session.requests), 2)
+
+    def _stub_market_sources(self, behaviour):
+        """Ersetzt _fetch_with_retry: je Quelle (Wartezeit, Antwort); zeichnet Starts und Abbrüche auf"""
+        started, cancelled = [], []
+        names = {endpoint: name for (endpoint, _), name in
+                 zip(self.analyzer._market_endpoints, ('coingecko', 'binance', 'kucoin'))}
+
+        async def fetch(url, params=None):
+            name = names[url]
+            started.append(name)
+            delay, response = behaviour[name]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return response
+
+        self.analyzer._fetch_with_retry = fetch
+        self.analyzer.market_fallback_delay = 0.05
+        return started, cancelled
+
+    def test_market_fallbacks_start_only_when_needed(self):
+        """Test, dass Fallbacks erst nach Fehlschlag oder Frist der vorherigen Quelle starten"""
+        coingecko = (200, {'solana': {'usd': 100.0}})
+        binance = (200, {'lastPrice': '101', 'volume': '5', 'priceChangePercent': '1'})
+        binance_normalized = {'price': 101.0, 'volume': 5.0, 'change': 1.0}
+        cases = (
+            # (Name, Verhalten je Quelle, Ergebnis, gestartete Quellen, abgebrochene Quellen)
+            ('Primär schnell', {'coingecko': (0.01, coingecko), 'binance': (0, binance), 'kucoin': (0, None)},
+             coingecko[1], ['coingecko'], []),
+            ('Primär scheitert', {'coingecko': (0.01, None), 'binance': (0.01, binance), 'kucoin': (0, None)},
+             binance_normalized, ['coingecko', 'binance'], []),
+            ('Primär zu langsam', {'coingecko': (1.0, coingecko), 'binance': (0.01, binance), 'kucoin': (1.0, None)},
+             binance_normalized, ['coingecko', 'binance'], ['coingecko']),
+            ('alle scheitern', {'coingecko': (0.01, None), 'binance': (0.01, None), 'kucoin': (0.01, None)},
+             {}, ['coingecko', 'binance', 'kucoin'], []),
+        )
+        for name, behaviour, expected, expected_started, expected_cancelled in cases:
+            with self.subTest(case=name):
+                started, cancelled = self._stub_market_sources(behaviour)
+                result = asyncio.run(self.analyzer._request_market_data())
+
+                self.assertEqual(started, expected_started)
+                self.assertEqual(cancelled, expected_cancelled)
+                self.assertEqual(result, expected)
+
+    def test_session_follows_event_loop(self):
+        """Test, dass ein neuer Event Loop Verbindungspool und Session ersetzt"""
+        async def open_session():
+            session = await self.analyzer._get_session()
+            return session, session.connector
+
+        first_session, first_connector = asyncio.run(open_session())
+
+        async def reopen_and_close():
+            session, connector = await open_session()
+            try:
+                # Innerhalb desselben Loops bleibt die Session bestehen
+                self.assertIs(await self.analyzer._get_session(), session)
+                return session, connector
+            finally:
+                await self.analyzer.aclose()
+                await close_shared_connector()
+
+        second_session, second_connector = asyncio.run(reopen_and_close())
+
+        self.assertIsNot(second_connector, first_connector)
+        self.assertIsNot(second_session, first_session)
+        self.assertTrue(first_connector.closed)
+        self.assertTrue(first_session.closed)
+        self.assertTrue(second_connector.closed)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.fetch_calls = 0
+
+    async def _fetch(self):
+        self.fetch_calls += 1
+        return {'solana': {'usd': 100.0 + self.fetch_calls}}
+
+    async def _fetch_empty(self):
+        self.fetch_calls += 1
+        return {}
+
+    def _analyzer(self, redis):
+        analyzer = SentimentAnalyzer()
+        analyzer.redis = redis
+        return analyzer
+
+    def test_redis_hit_across_instances(self):
+        """Test, dass ein zweiter Prozess (neue Instanz) die Daten aus Redis erhält"""
+        redis = _FakeRedis()
+
+        async def run_test():
+            first = await self._analyzer(redis)._cached_fetch('coingecko_price', 'https://api.test', self._fetch)
+            second_analyzer = self._analyzer(redis)
+            second = await second_analyzer._cached_fetch('coingecko_price', 'https://api.test', self._fetch)
+            return first, second, second_analyzer
+
+        first, second, second_analyzer = asyncio.run(run_test())
+        self.assertEqual(first, {'solana': {'usd': 101.0}})
+        self.assertEqual(second, first)
+        self.assertEqual(self.fetch_calls, 1)
+        self.assertEqual((second_analyzer.cache_hits, second_analyzer.cache_misses), (1, 0))
+
+    def test_per_source_ttls(self):
+        """Test der TTLs je Quelle inkl. veralteter Fallback-Kopie"""
+        for name in CACHE_POLICIES:
+            with self.subTest(source=name):
+                redis = _FakeRedis()
+                asyncio.run(self._analyzer(redis)._cached_fetch(name, f'https://{name}.test', self._fetch))
+                self.assertEqual(
+                    sorted(redis.ttls.values()),
+                    [CACHE_POLICIES[name], CACHE_POLICIES[name] * STALE_TTL_FACTOR]
+                )
+
+    def test_stale_copy_when_source_fails(self):
+        """Test der veralteten Kopie, wenn die Quelle nach Ablauf der TTL nichts liefert"""
+        redis = _FakeRedis()
+        with freeze_time('2025-03-08 12:00:00', real_asyncio=True) as frozen:
+            asyncio.run(self._analyzer(redis)._cached_fetch('dex_pairs', 'https://dex.test', self._fetch))
+            frozen.tick(CACHE_POLICIES['dex_pairs'] + 1)
+
+            result = asyncio.run(self._analyzer(redis)._cached_fetch('dex_pairs', 'https://dex.test', self._fetch_empty))
+
+        self.assertEqual(result, {'solana': {'usd': 101.0}})
+        self.assertEqual(self.fetch_calls, 2)
+
+    def test_unreachable_redis_falls_back_to_fetch(self):
+        """Test, dass ein nicht erreichbares Redis nur zu direkten Abrufen führt"""
+        analyzer = self._analyzer(_FakeRedis(fail=True))
+
+        with self.assertLogs('sentiment_analyzer', level='WARNING') as logs:
+            result = asyncio.run(analyzer._cached_fetch('social', 'https://social.test', self._fetch))
+
+        self.assertEqual(result, {'solana': {'usd': 101.0}})
+        self.assertEqual(analyzer.cache_misses, 1)
+        self.assertTrue(any("Redis Cache nicht verfügbar" in line for line in logs.output))
+
+    def test_process_cache_expiry(self):
+        """Test des Prozess-Caches ohne Redis: Treffer innerhalb der TTL, neuer Abruf danach"""
+        analyzer = self._analyzer(None)
+        ttl = CACHE_POLICIES['coingecko_price']
+
+        with freeze_time('2025-03-08 12:00:00', real_asyncio=True) as frozen:
+            fetch = lambda: analyzer._cached_fetch('coingecko_price', 'https://api.test', self._fetch)
+            first = asyncio.run(fetch())
+            frozen.tick(ttl - 1)
+            self.assertEqual(asyncio.run(fetch()), first)
+            self.assertEqual(self.fetch_calls, 1)
+
+            frozen.tick(1)
+            self.assertEqual(asyncio.run(fetch()), {'solana': {'usd': 102.0}})
+            self.assertEqual(self.fetch_calls, 2)
+
+            # Ungültige Ergebnisse werden nicht zwischengespeichert
+            empty = lambda: analyzer._cached_fetch('dex_pairs', 'https://dex.test', self._fetch_empty)
+            asyncio.run(empty())
+            asyncio.run(empty())
+            self.assertEqual(self.fetch_calls, 4)
+
+            # Geänderte URL umgeht den alten Eintrag
+            asyncio.run(analyzer._cached_fetch('coingecko_price', 'https://other.test', self._fetch))
+            self.assertEqual(self.fetch_calls, 5)
+
+    def test_process_cache_in_front_of_redis(self):
+        """Test des Zusammenspiels: Prozess-Cache vor Redis, gemeinsame TTL ab dem ersten Abruf"""
+        redis = _FakeRedis()
+        ttl = CACHE_POLICIES['dex_pairs']
+
+        with freeze_time('2025-03-08 12:00:00', real_asyncio=True) as frozen:
+            writer = self._analyzer(redis)
+            asyncio.run(writer._cached_fetch('dex_pairs', 'https://dex.test', self._fetch))
+            frozen.tick(ttl - 10)
+
+            # Zweite Instanz: Treffer aus Redis, danach aus dem eigenen Prozess-Cache
+            reader = self._analyzer(redis)
+            fetch = lambda: reader._cached_fetch('dex_pairs', 'https://dex.test', self._fetch)
+            asyncio.run(fetch())
+            gets = redis.gets
+            asyncio.run(fetch())
+            self.assertEqual(redis.gets, gets)
+            self.assertEqual(self.fetch_calls, 1)
+
+            # Prozess-Cache übernimmt nur die Rest-Laufzeit aus Redis, nicht die volle TTL
+            frozen.tick(10)
+            asyncio.run(fetch())
+            self.assertEqual(self.fetch_calls, 2)
+
+
+class TestSentimentRefresh(unittest.TestCase):
+    def test_background_refresh_lifecycle(self):
+        """Test von start(), _refresh_loop und aclose()"""
+        analyzer = SentimentAnalyzer()
+        calls = []
+
+        async def analyze_once():
+            calls.append(1)
+            return {'overall_score': 0.7, 'sources': {'dex': {'score': 0.7}}, 'round': len(calls)}
+
+        analyzer._analyze_once = analyze_once
+        analyzer.refresh_interval = 0.01
+
+        async def run_test():
+            # Ohne Hintergrund-Aktualisierung wird direkt analysiert
+            await analyzer.analyze_market_sentiment()
+            self.assertEqual(len(calls), 1)
+
+            await analyzer.start()
+            task = analyzer._refresh_task
+            await analyzer.start()  # Zweiter Start erzeugt keinen weiteren Task
+            self.assertIs(analyzer._refresh_task, task)
+
+            await asyncio.sleep(0.05)
+            self.assertGreater(len(calls), 2)
+
+            # Ergebnis kommt aus dem Hintergrund-Stand, ohne zusätzliche Analyse
+            calls_before = len(calls)
+            result = await analyzer.analyze_market_sentiment()
+            self.assertEqual(len(calls), calls_before)
+            self.assertEqual(result['overall_score'], 0.7)
+
+            # Änderungen am Ergebnis verfälschen den geteilten Stand nicht
+            result['overall_score'] = 0.0
+            result['sources']['dex']['score'] = 0.0
+            self.assertEqual(analyzer._last_sentiment['overall_score'], 0.7)
+            self.assertEqual(analyzer._last_sentiment['sources']['dex']['score'], 0.7)
+
+            await analyzer.aclose()
+            self.assertIsNone(analyzer._refresh_task)
+            self.assertTrue(task.cancelled())
+
+            # Nach aclose() wird wieder direkt analysiert
+            calls_before = len(calls)
+            await analyzer.analyze_market_sentiment()
+            self.assertEqual(len(calls), calls_before + 1)
+
+        asyncio.run(run_test())
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_delta_seconds(self):
+        """Test der Retry-After Angabe in Sekunden"""
+        self.assertEqual(_parse_retry_after("120"), 120.0)
+        self.assertEqual(_parse_retry_after("1.5"), 1.5)
+        self.assertEqual(_parse_retry_after("0"), 0.0)
+        self.assertEqual(_parse_retry_after("-5"), 0.0)  # Negative Werte nicht in die Vergangenheit
+
+    def test_http_date(self):
+        """Test der Retry-After Angabe als HTTP-Datum"""
+        with freeze_time('2025-03-08 12:00:00'):
+            self.assertEqual(_parse_retry_after("Sat, 08 Mar 2025 12:00:30 GMT"), 30.0)
+            self.assertEqual(_parse_retry_after("Sat, 08 Mar 2025 11:59:00 GMT"), 0.0)
+
+    def test_invalid_values(self):
+        """Test fehlender und ungültiger Retry-After Werte"""
+        for value in (None, "", "bald", "Sat, 99 Foo 2025"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_retry_after(value))
+
+    def test_backoff_bounds(self):
+        """Test der Wartezeit nach 429: Backoff mit Jitter bzw. Retry-After, begrenzt auf MAX_RETRY_AFTER"""
+        url = "https://api.host-a.test/data"
+
+        async def observe_waits(retry_after, retry_delay):
+            analyzer = SentimentAnalyzer()
+            analyzer.retry_delay = retry_delay
+            analyzer.max_retries = 5
+            loop = asyncio.get_running_loop()
+            waits = []
+
+            async def no_throttle(_):
+                pass
+
+            async def send_request(*_):
+                # Restliche Sperre des Hosts = Wartezeit nach dem vorherigen 429
+                if analyzer._backoff_until:
+                    waits.append(analyzer._backoff_until['api.host-a.test'] - loop.time())
+                return 429, retry_after, None
+
+            # Gesperrt wird in _backoff_until, die Wartezeit selbst wird hier übersprungen
+            analyzer._throttle = no_throttle
+            analyzer._send_request = send_request
+            self.assertIsNone(await analyzer._fetch_with_retry(url))
+            return waits
+
+        for _ in range(20):
+            waits = asyncio.run(observe_waits(None, 0.1))
+            self.assertEqual(len(waits), 4)
+            for attempt, wait in enumerate(waits):
+                base = 0.1 * 2 ** attempt
+                self.assertGreaterEqual(wait, base - 0.01)
+                self.assertLessEqual(wait, base + 0.5)
+
+        # Exponentieller Backoff und Retry-After werden auf MAX_RETRY_AFTER begrenzt
+        self.assertLessEqual(max(asyncio.run(observe_waits(None, 10))), MAX_RETRY_AFTER)
+        self.assertLessEqual(max(asyncio.run(observe_waits("3600", 0.1))), MAX_RETRY_AFTER)
+        self.assertGreater(min(asyncio.run(observe_waits("3600", 0.1))), MAX_RETRY_AFTER - 1)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
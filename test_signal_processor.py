@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+from signal_processor import SignalProcessor
+
+
+def make_signal(pair='SOL/USD', **overrides):
+    """Erzeugt ein gültiges Test-Signal, einzelne Felder überschreibbar"""
+    signal = {
+        'pair': pair,
+        'direction': 'long',
+        'entry': 100.0,
+        'stop_loss': 98.0,
+        'take_profit': 105.0,
+        'expected_profit': 5.0,
+        'signal_quality': 8.0,
+        'trend_strength': 0.8
+    }
+    signal.update(overrides)
+    return signal
+
+
+class TestSignalProcessor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Ein Processor für alle Tests, der Signal-Speicher wird in setUp geleert
+        cls.shared_processor = SignalProcessor()
+
+    def setUp(self):
+        self.processor = self.shared_processor
+        self.processor.active_signals.clear()
+        self.processor._evicted_signals = 0
+        for signals in self.processor._by_status.values():
+            signals.clear()
+
+    def test_batch_skips_invalid_signals(self):
+        """Test, dass ungültige Signale einzeln übersprungen werden"""
+        signals = [
+            make_signal('SOL/USD'),
+            make_signal('BONK/USD', entry='kein Preis'),
+            {'pair': 'JUP/USD'},  # Pflichtfelder fehlen
+            make_signal('RAY/USD', signal_quality=None),
+            make_signal('ORCA/USD', stop_loss=0),
+        ]
+
+        results = self.processor.process_signals_batch(signals)
+
+        self.assertEqual([result['pair'] for result in results], ['SOL/USD', 'RAY/USD'])
+        self.assertEqual(results[0]['entry'], 100.0)
+        self.assertEqual(len(self.processor.active_signals), 2)
+
+    def test_batch_quality_filter(self):
+        """Test der Qualitätsschwelle im Batch"""
+        signals = [
+            make_signal('SOL/USD', signal_quality=8.0),
+            make_signal('BONK/USD', signal_quality=4.0),
+            make_signal('RAY/USD', signal_quality=None),
+            make_signal('JUP/USD', signal_quality='7.5'),
+        ]
+
+        results = self.processor.process_signals_batch(signals, min_quality=7.0)
+
+        self.assertEqual([result['pair'] for result in results], ['SOL/USD', 'JUP/USD'])
+        self.assertEqual(self.processor.process_signals_batch([]), [])
+
+    def test_status_index(self):
+        """Test der Status-Abfragen und des Verschiebens beim Ausführen"""
+        processed = [self.processor.process_signal(make_signal(pair)) for pair in ('SOL/USD', 'BONK/USD', 'RAY/USD')]
+
+        active = self.processor.get_active_signals()
+        self.assertEqual(active, processed)
+        self.assertIsInstance(active[0], dict)
+        self.assertEqual(self.processor.get_executed_signals(), [])
+
+        # Signal-IDs entsprechen der Einfügereihenfolge
+        self.processor.mark_signal_executed(1)
+
+        self.assertEqual([s['pair'] for s in self.processor.get_active_signals()], ['SOL/USD', 'RAY/USD'])
+        executed = self.processor.get_executed_signals()
+        self.assertEqual([s['pair'] for s in executed], ['BONK/USD'])
+        self.assertEqual(executed[0]['status'], 'ausgeführt')
+
+        # Erneutes Markieren und unbekannte IDs ändern nichts
+        self.processor.mark_signal_executed(1)
+        self.processor.mark_signal_executed(99)
+        self.assertEqual(len(self.processor.get_active_signals()), 2)
+        self.assertEqual(len(self.processor.get_executed_signals()), 1)
+
+        # Zurückgegebene Dicts sind Kopien, der gespeicherte Zustand bleibt unverändert
+        executed[0]['status'] = 'neu'
+        self.assertEqual(self.processor.get_executed_signals()[0]['status'], 'ausgeführt')
+
+    def test_eviction_cleans_status_index(self):
+        """Test, dass verdrängte Signale Speicher und Status-Index verlassen"""
+        with patch('signal_processor.MAX_STORED_SIGNALS', 3):
+            processor = SignalProcessor()
+
+        for pair in ('A/USD', 'B/USD', 'C/USD'):
+            processor.process_signal(make_signal(pair))
+        processor.mark_signal_executed(0)
+
+        # Zwei weitere Signale verdrängen A (ausgeführt) und B (neu)
+        for pair in ('D/USD', 'E/USD'):
+            processor.process_signal(make_signal(pair))
+
+        self.assertEqual([s.pair for s in processor.active_signals], ['C/USD', 'D/USD', 'E/USD'])
+        self.assertEqual(list(processor._by_status['neu']), [2, 3, 4])
+        self.assertEqual(processor._by_status['ausgeführt'], {})
+        self.assertEqual([s['pair'] for s in processor.get_active_signals()], ['C/USD', 'D/USD', 'E/USD'])
+
+        # Verdrängte IDs lassen sich nicht mehr markieren, neue IDs zählen weiter
+        processor.mark_signal_executed(1)
+        processor.mark_signal_executed(4)
+        self.assertEqual([s['pair'] for s in processor.get_executed_signals()], ['E/USD'])
+        self.assertEqual(len(processor.get_active_signals()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch
+from wallet_manager import WalletManager, BALANCE_CACHE_TTL
+
+
+class TestWalletBalanceCache(unittest.TestCase):
+    def setUp(self):
+        client_patcher = patch('wallet_manager.Client')
+        self.addCleanup(client_patcher.stop)
+        self.client = client_patcher.start().return_value
+        self.client.get_version.return_value = {'result': {'solana-core': '1.18.0'}}
+        self.client.get_balance.return_value = {'result': {'value': 1_500_000_000}}
+
+        monotonic_patcher = patch('wallet_manager.monotonic')
+        self.addCleanup(monotonic_patcher.stop)
+        self.monotonic = monotonic_patcher.start()
+
+        self.wallet = WalletManager("https://rpc.test")
+        self.wallet.create_wallet()
+
+    def test_first_call_fetches_even_shortly_after_boot(self):
+        """Test, dass ein leerer Cache auch bei kleiner Monotonic-Zeit nicht als frisch gilt"""
+        self.monotonic.return_value = 0.5
+
+        self.assertEqual(self.wallet.get_balance(), 1.5)
+        self.assertEqual(self.client.get_balance.call_count, 1)
+
+    def test_balance_reused_within_ttl_and_refetched_after(self):
+        """Test der Wiederverwendung innerhalb der TTL und des erneuten Abrufs danach"""
+        self.monotonic.return_value = 100.0
+        self.assertEqual(self.wallet.get_balance(), 1.5)
+
+        # Innerhalb der TTL kommt das Guthaben aus dem Cache
+        self.client.get_balance.return_value = {'result': {'value': 2_000_000_000}}
+        self.monotonic.return_value = 100.0 + BALANCE_CACHE_TTL - 0.1
+        self.assertEqual(self.wallet.get_balance(), 1.5)
+        self.assertEqual(self.client.get_balance.call_count, 1)
+
+        # Nach Ablauf der TTL geht die Abfrage wieder an den RPC
+        self.monotonic.return_value = 100.0 + BALANCE_CACHE_TTL
+        self.assertEqual(self.wallet.get_balance(), 2.0)
+        self.assertEqual(self.client.get_balance.call_count, 2)
+
+    def test_wallet_change_clears_cache(self):
+        """Test, dass ein Wallet-Wechsel das zwischengespeicherte Guthaben verwirft"""
+        self.monotonic.return_value = 100.0
+        self.wallet.get_balance()
+
+        self.wallet.create_wallet()
+        self.assertIsNone(self.wallet._balance_cache)
+        self.wallet.get_balance()
+        self.assertEqual(self.client.get_balance.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from solana.rpc.api import Client
 from solana.keypair import Keypair
 from solana.system_program import TransferParams, transfer
@@ -7,12 +8,18 @@ from base58 import b58encode, b58decode
 import qrcode
 from io import BytesIO
 from datetime import datetime, timedelta
+from time import monotonic
 import cv2
-import numpy as np
-from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Guthaben wird so lange (Sekunden) wiederverwendet, bündelt schnell aufeinanderfolgende RPC-Abfragen
+BALANCE_CACHE_TTL = 2.0
+
+# QR-Scan: nur jedes n-te Kamerabild auswerten, breitere Bilder vorher verkleinern
+QR_SCAN_FRAME_STEP = 3
+QR_SCAN_MAX_WIDTH = 640
+
 class WalletManager:
     def __init__(self, rpc_url: str):
         """Initialisiert den Wallet Manager mit echter Solana-Verbindung"""
@@ -21,6 +28,10 @@ class WalletManager:
             self.client = Client(rpc_url, commitment="confirmed")
             self.keypair = None
             self._active = False
+            # Zuletzt abgerufenes Guthaben: (Wert in SOL, Zeitpunkt des Abrufs), None = noch nicht abgerufen
+            self._balance_cache: Optional[tuple[float, float]] = None
+            # Base58-Adresse des aktuellen Keypairs, wird nur beim Wechsel neu kodiert
+            self._address_cache = ""
 
             # Validiere RPC-Verbindung
             version = self.client.get_version()
@@ -36,8 +47,10 @@ class WalletManager:
             logger.info("Erstelle neue Solana-Wallet...")
             self.keypair = Keypair()
             self._active = True
+            self._balance_cache = None
+            self._address_cache = str(self.keypair.public_key)
 
-            public_key = str(self.keypair.public_key)
+            public_key = self._address_cache
             private_key = b58encode(bytes(self.keypair.secret_key)).decode('ascii')
 
             logger.info(f"Neue Wallet erstellt mit Adresse: {public_key[:8]}...")
@@ -46,6 +59,7 @@ class WalletManager:
         except Exception as e:
             logger.error(f"Fehler beim Erstellen der Wallet: {e}")
             self._active = False
+            self._address_cache = ""
             return "", ""
 
     def load_wallet(self, private_key: str) -> bool:
@@ -55,11 +69,14 @@ class WalletManager:
             secret_key = b58decode(private_key)
             self.keypair = Keypair.from_secret_key(bytes(secret_key))
             self._active = True
-            logger.info(f"Wallet erfolgreich geladen mit Adresse: {str(self.keypair.public_key)[:8]}...")
+            self._balance_cache = None
+            self._address_cache = str(self.keypair.public_key)
+            logger.info(f"Wallet erfolgreich geladen mit Adresse: {self._address_cache[:8]}...")
             return True
         except Exception as e:
             logger.error(f"Fehler beim Laden der Wallet: {e}")
             self._active = False
+            self._address_cache = ""
             return False
 
     def get_balance(self) -> float:
@@ -69,11 +86,17 @@ class WalletManager:
                 logger.warning("get_balance aufgerufen ohne aktive Wallet")
                 return 0.0
 
-            logger.debug(f"Rufe Guthaben ab für Adresse: {str(self.keypair.public_key)[:8]}...")
+            if self._balance_cache is not None:
+                balance, fetched_at = self._balance_cache
+                if monotonic() - fetched_at < BALANCE_CACHE_TTL:
+                    return balance
+
+            logger.debug("Rufe Guthaben ab für Adresse: %s...", self._address_cache[:8])
             response = self.client.get_balance(self.keypair.public_key)
 
             if 'result' in response and 'value' in response['result']:
                 balance = float(response['result']['value']) / 1e9
+                self._balance_cache = (balance, monotonic())
                 logger.info(f"Aktuelles Guthaben: {balance} SOL")
                 return balance
 
@@ -128,6 +151,8 @@ class WalletManager:
             )
 
             if 'result' in result:
+                # Guthaben hat sich geändert, nächste Abfrage geht wieder an den RPC
+                self._balance_cache = None
                 logger.info(f"Transaktion erfolgreich: {result['result']}")
                 return True, result['result']
 
@@ -143,8 +168,8 @@ class WalletManager:
             logger.warning("get_address aufgerufen ohne aktive Wallet")
             return ""
 
-        address = str(self.keypair.public_key)
-        logger.debug(f"Wallet-Adresse abgerufen: {address[:8]}...")
+        address = self._address_cache
+        logger.debug("Wallet-Adresse abgerufen: %s...", address[:8])
         return address
 
     def generate_qr_code(self) -> BytesIO:
@@ -190,20 +215,33 @@ class WalletManager:
         """Scannt einen QR-Code mit der Kamera"""
         try:
             cap = cv2.VideoCapture(0)
+            detector = cv2.QRCodeDetector()
+            frame_idx = 0
             while True:
                 ret, frame = cap.read()
                 if not ret:
                     continue
 
-                detector = cv2.QRCodeDetector()
-                data, bbox, _ = detector.detectAndDecode(frame)
+                # Nur jedes QR_SCAN_FRAME_STEP-te Bild auswerten, verkleinert auf höchstens VGA-Breite
+                if frame_idx % QR_SCAN_FRAME_STEP == 0:
+                    height, width = frame.shape[:2]
+                    if width > QR_SCAN_MAX_WIDTH:
+                        scale = QR_SCAN_MAX_WIDTH / width
+                        scan_frame = cv2.resize(frame, (QR_SCAN_MAX_WIDTH, int(height * scale)),
+                                                interpolation=cv2.INTER_AREA)
+                    else:
+                        scan_frame = frame
+
+                    data, bbox, _ = detector.detectAndDecode(scan_frame)
 
-                if data:
-                    cap.release()
-                    return data
+                    if data:
+                        cap.release()
+                        cv2.destroyAllWindows()
+                        return data
+                frame_idx += 1
 
                 cv2.imshow('QR Scanner', frame)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                if cv2.waitKey(10) & 0xFF == ord('q'):
                     break
 
             cap.release()